@@ -4012,6 +4012,39 @@ let huntarrUI = {
         })
         .then(response => response.json())
         .then(data => {
+            if (data.pending) {
+                // The server applies the timezone in the background; wait for the result
+                this.pollTimezoneApply(timezone);
+            } else {
+                console.error('[huntarrUI] Failed to apply timezone:', data.error);
+                this.showNotification(`Failed to apply timezone: ${data.error}`, 'error');
+            }
+        })
+        .catch(error => {
+            console.error('[huntarrUI] Error applying timezone:', error);
+            this.showNotification(`Error applying timezone: ${error.message}`, 'error');
+        });
+    },
+
+    // Poll the background timezone apply until it finishes
+    pollTimezoneApply: function(timezone, attempt = 0) {
+        const maxAttempts = 40; // 20 seconds at 500ms intervals
+        
+        fetch('./api/settings/apply-timezone/status')
+        .then(response => response.json())
+        .then(data => {
+            if (data.timezone !== timezone) {
+                // A newer timezone change superseded this one; its own poll reports the result
+                return;
+            }
+            if (data.pending) {
+                if (attempt < maxAttempts) {
+                    setTimeout(() => this.pollTimezoneApply(timezone, attempt + 1), 500);
+                } else {
+                    console.warn('[huntarrUI] Timed out waiting for timezone to apply');
+                }
+                return;
+            }
             if (data.success) {
                 console.log('[huntarrUI] Timezone applied successfully');
                 // Settings auto-save notification removed per user request
@@ -4019,12 +4052,12 @@ let huntarrUI = {
                 // Refresh any time displays that might be affected
                 this.refreshTimeDisplays();
             } else {
-                console.error('[huntarrUI] Failed to apply timezone:', data.error);
-                this.showNotification(`Failed to apply timezone: ${data.error}`, 'error');
+                console.error('[huntarrUI] Failed to apply timezone:', timezone);
+                this.showNotification(`Failed to apply timezone: ${timezone}`, 'error');
             }
         })
         .catch(error => {
-            console.error('[huntarrUI] Error applying timezone:', error);
+            console.error('[huntarrUI] Error checking timezone status:', error);
             this.showNotification(`Error applying timezone: ${error.message}`, 'error');
         });
     },
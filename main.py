@@ -272,8 +272,13 @@ def run_web_server():
             import time
             web_logger.info("Running with Waitress production server.")
             
-            # Create the server instance so we can shut it down gracefully
-            waitress_server = create_server(app, host=host, port=port, threads=8)
+            # Create the server instance so we can shut it down gracefully.
+            # UI polls (status checks, cycle status, logs) can each wait on outbound
+            # HTTP calls, so size the worker pool to the host rather than a fixed 8.
+            waitress_threads = min(32, (os.cpu_count() or 4) * 4)
+            waitress_server = create_server(app, host=host, port=port, threads=waitress_threads,
+                                            channel_timeout=60, connection_limit=512)
+            web_logger.info(f"Waitress using {waitress_threads} worker threads")
             
             web_logger.info("Waitress server starting...")
             
@@ -351,8 +356,10 @@ def main_shutdown_handler(signum, frame):
         except Exception as e:
             huntarr_logger.warning(f"Main database emergency checkpoint failed: {e}")
         
-        # Emergency checkpoint for logs database
+        # Emergency checkpoint for logs database, after writing any batched log records
         try:
+            from primary.utils.clean_logger import flush_pending_logs
+            flush_pending_logs()
             logs_db = get_logs_database()
             with logs_db.get_logs_connection() as conn:
                 conn.execute("PRAGMA wal_checkpoint(RESTART)")
@@ -406,6 +413,10 @@ def cleanup_handler():
             except Exception as db_error:
                 huntarr_logger.warning(f"Error during main database cleanup: {db_error}")
         
+        # Write any batched log records before closing the logs database
+        from primary.utils.clean_logger import flush_pending_logs
+        flush_pending_logs()
+        
         # Close logs database connections
         logs_db = get_logs_database()
         if hasattr(logs_db, '_logs_database_instance') and logs_db._logs_database_instance is not None:
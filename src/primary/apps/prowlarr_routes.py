@@ -1,61 +1,151 @@
 #!/usr/bin/env python3
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, Response
+import orjson
+import heapq
+import logging
+import queue
+from operator import itemgetter, mul
 import requests
-import socket
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 import time
 import threading
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 from src.primary.utils.logger import get_logger
 from src.primary.settings_manager import get_ssl_verify_setting, load_settings
-import traceback
 
 prowlarr_bp = Blueprint('prowlarr', __name__)
 prowlarr_logger = get_logger("prowlarr")
 
+SECONDS_PER_DAY = 86400
+
+# URL schemes accepted for the Prowlarr API URL; anything else gets http:// prepended
+URL_SCHEMES = ('http://', 'https://')
+
+# Connect timeout for connection tests, in seconds
+CONNECT_TIMEOUT = 3
+
+# Substrings of connection errors raised when the hostname cannot be resolved
+DNS_ERROR_MARKERS = (
+    "Name or service not known",
+    "getaddrinfo failed",
+    "Temporary failure in name resolution",
+    "nodename nor servname provided"
+)
+
+# Number of busiest indexers reported in indexer_performance
+TOP_INDEXERS_LIMIT = 10
+
+# Upper bound on history response bodies, to keep a huge history from bloating the worker
+HISTORY_MAX_BYTES = 4 * 1024 * 1024
+
+# Shared read-only defaults for missing status/capabilities/daily-stats entries
+_EMPTY_DICT = {}
+_EMPTY_DAILY_STATS = {
+    'searches_today': 0,
+    'searches_yesterday': 0,
+    'successful_today': 0,
+    'failed_today': 0
+}
+
+# Bounds for the statistics cache lifetime, which adapts to Prowlarr's response time
+STATS_CACHE_MIN_DURATION = 60
+STATS_CACHE_MAX_DURATION = 600
+
 # Cache for statistics
 _stats_cache = {
     'data': None,
     'timestamp': 0,
-    'cache_duration': 300  # 5 minutes in seconds
+    'cache_duration': 300,  # 5 minutes in seconds, adjusted after each fetch
+    'refreshing': False  # True while a background refresh is in flight
 }
 _cache_lock = threading.Lock()
+_inflight_event = None  # Set while the initial stats fetch is running, so other callers wait on it
+_refresh_queue = queue.Queue(maxsize=1)  # Coalesces stats refresh requests for the worker thread
+_refresh_worker = None  # Started on the first refresh request
+
+# Short-lived cache of the Prowlarr settings used on every status/stats request
+_settings_cache = {
+    'value': None,
+    'timestamp': 0,
+    'cache_duration': 10  # seconds
+}
+_settings_lock = threading.Lock()
+
+# Last known result of the /status connection test, refreshed in the background
+_conn_cache = {
+    'connected': False,
+    'timestamp': 0,
+    'cache_duration': 15,  # seconds
+    'refreshing': False
+}
+
+# Serialized /status response, reused between closely spaced UI polls
+_status_cache = {
+    'body': None,
+    'timestamp': 0,
+    'cache_duration': 2  # seconds
+}
+
+# Use a pooled session so repeated calls to Prowlarr reuse connections
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+
+# Worker pool for fetching independent statistics endpoints concurrently
+_stats_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="prowlarr-stats")
+
+def _json(obj, status=200):
+    """Build a JSON response with orjson (indexer stats are keyed by integer IDs)"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype='application/json')
+
+def _get_prowlarr_settings():
+    """Get the Prowlarr connection settings, cached for a few seconds"""
+    with _settings_lock:
+        if (_settings_cache['value'] is not None and
+                time.time() - _settings_cache['timestamp'] < _settings_cache['cache_duration']):
+            return _settings_cache['value']
+    
+    settings = load_settings("prowlarr")
+    api_url = settings.get("api_url", "").strip()
+    
+    # Normalize the URL once so request handlers can build endpoints directly
+    base_url = api_url
+    if base_url and not base_url.startswith(URL_SCHEMES):
+        base_url = f'http://{base_url}'
+    
+    value = {
+        'api_url': api_url,
+        'base_url': base_url.rstrip('/'),
+        'api_key': settings.get("api_key", "").strip(),
+        'enabled': settings.get("enabled", True)
+    }
+    
+    with _settings_lock:
+        _settings_cache['value'] = value
+        _settings_cache['timestamp'] = time.time()
+    return value
+
+def clear_settings_cache():
+    """Drop the cached Prowlarr settings so the next request reloads them"""
+    with _settings_lock:
+        _settings_cache['value'] = None
+        _settings_cache['timestamp'] = 0
+    _status_cache['body'] = None
+    with _cache_lock:
+        _conn_cache['timestamp'] = 0
 
 def test_connection(url, api_key, timeout=30):
     """Test connection to Prowlarr API"""
     try:
         # Auto-correct URL if missing http(s) scheme
-        if not (url.startswith('http://') or url.startswith('https://')):
-            prowlarr_logger.debug(f"Auto-correcting URL to: {url}")
+        if not url.startswith(URL_SCHEMES):
             url = f"http://{url}"
             prowlarr_logger.debug(f"Auto-correcting URL to: {url}")
         
-        # Try to establish a socket connection first to check basic connectivity
-        parsed_url = urlparse(url)
-        hostname = parsed_url.hostname
-        port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
-        
-        try:
-            # Try socket connection for quick feedback on connectivity issues
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(3)  # Short timeout for quick feedback
-            result = sock.connect_ex((hostname, port))
-            sock.close()
-            
-            if result != 0:
-                error_msg = f"Connection refused - Unable to connect to {hostname}:{port}. Please check if the server is running and the port is correct."
-                prowlarr_logger.error(error_msg)
-                return {"success": False, "message": error_msg}
-        except socket.gaierror:
-            error_msg = f"DNS resolution failed - Cannot resolve hostname: {hostname}. Please check your URL."
-            prowlarr_logger.error(error_msg)
-            return {"success": False, "message": error_msg}
-        except Exception as e:
-            # Log the socket testing error but continue with the full request
-            prowlarr_logger.debug(f"Socket test error, continuing with full request: {str(e)}")
-        
         # Create the test URL and set headers - Prowlarr uses v1 API
         test_url = f"{url.rstrip('/')}/api/v1/system/status"
         headers = {'X-Api-Key': api_key}
@@ -66,8 +156,8 @@ def test_connection(url, api_key, timeout=30):
         if not verify_ssl:
             prowlarr_logger.debug("SSL verification disabled by user setting for connection test")
 
-        # Make the API request
-        response = requests.get(test_url, headers=headers, timeout=(10, timeout), verify=verify_ssl)
+        # Make the API request - a short connect timeout gives quick feedback on unreachable hosts
+        response = session.get(test_url, headers=headers, timeout=(CONNECT_TIMEOUT, timeout), verify=verify_ssl)
         
         # Handle HTTP errors
         if response.status_code == 401:
@@ -92,7 +182,7 @@ def test_connection(url, api_key, timeout=30):
         
         # Ensure the response is valid JSON
         try:
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             
             # Return success with some useful information
             return {
@@ -105,6 +195,13 @@ def test_connection(url, api_key, timeout=30):
             prowlarr_logger.error(f"{error_msg}. Response content: {response.text[:200]}")
             return {"success": False, "message": error_msg}
 
+    except requests.exceptions.ConnectTimeout as e:
+        parsed_url = urlparse(url)
+        port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
+        error_msg = f"Connection timed out - Unable to connect to {parsed_url.hostname}:{port} within {CONNECT_TIMEOUT} seconds"
+        prowlarr_logger.error(f"{error_msg}: {str(e)}")
+        return {"success": False, "message": error_msg}
+        
     except requests.exceptions.Timeout as e:
         error_msg = f"Connection timed out after {timeout} seconds"
         prowlarr_logger.error(f"{error_msg}: {str(e)}")
@@ -113,10 +210,12 @@ def test_connection(url, api_key, timeout=30):
     except requests.exceptions.ConnectionError as e:
         # Handle different types of connection errors
         error_details = str(e)
+        parsed_url = urlparse(url)
         if "Connection refused" in error_details:
-            error_msg = f"Connection refused - Prowlarr is not running on {url} or the port is incorrect"
-        elif "Name or service not known" in error_details or "getaddrinfo failed" in error_details:
-            error_msg = f"DNS resolution failed - Cannot find host '{urlparse(url).hostname}'. Check your URL."
+            port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
+            error_msg = f"Connection refused - Unable to connect to {parsed_url.hostname}:{port}. Please check if the server is running and the port is correct."
+        elif any(marker in error_details for marker in DNS_ERROR_MARKERS):
+            error_msg = f"DNS resolution failed - Cannot resolve hostname: {parsed_url.hostname}. Please check your URL."
         else:
             error_msg = f"Connection error - Check if Prowlarr is running: {error_details}"
             
@@ -129,77 +228,117 @@ def test_connection(url, api_key, timeout=30):
         return {"success": False, "message": error_msg}
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        prowlarr_logger.error(f"{error_msg}\n{traceback.format_exc()}")
+        # Only capture the traceback when debug logging will actually emit it
+        prowlarr_logger.error(error_msg, exc_info=prowlarr_logger.isEnabledFor(logging.DEBUG))
         return {"success": False, "message": error_msg}
 
+def _refresh_connection_status(api_url, api_key):
+    """Run the status connection test and record the result"""
+    try:
+        test_result = test_connection(api_url, api_key, 5)  # Short timeout for status checks
+        with _cache_lock:
+            _conn_cache['connected'] = test_result['success']
+            _conn_cache['timestamp'] = time.time()
+    finally:
+        with _cache_lock:
+            _conn_cache['refreshing'] = False
+
+def _get_connection_status(api_url, api_key):
+    """Get the last known connection state, refreshing it in background once it expires"""
+    with _cache_lock:
+        connected = _conn_cache['connected']
+        checked = _conn_cache['timestamp'] > 0
+        is_stale = time.time() - _conn_cache['timestamp'] > _conn_cache['cache_duration']
+        start_refresh = is_stale and not _conn_cache['refreshing']
+        if start_refresh:
+            _conn_cache['refreshing'] = True
+    
+    if start_refresh:
+        if not checked:
+            # Nothing known yet - check synchronously so the first status is accurate
+            _refresh_connection_status(api_url, api_key)
+            with _cache_lock:
+                connected = _conn_cache['connected']
+        else:
+            threading.Thread(target=_refresh_connection_status, args=(api_url, api_key), daemon=True).start()
+    
+    return connected
+
 @prowlarr_bp.route('/status', methods=['GET'])
 def get_status():
     """Get the status of configured Prowlarr instance"""
+    cached_body = _status_cache['body']
+    if cached_body is not None and time.time() - _status_cache['timestamp'] < _status_cache['cache_duration']:
+        return Response(cached_body, mimetype='application/json')
+    
     try:
-        settings = load_settings("prowlarr")
+        settings = _get_prowlarr_settings()
         
-        api_url = settings.get("api_url", "").strip()
-        api_key = settings.get("api_key", "").strip()
-        enabled = settings.get("enabled", True)
+        api_url = settings['api_url']
+        api_key = settings['api_key']
+        enabled = settings['enabled']
         
         if not api_url or not api_key:
             prowlarr_logger.debug("Prowlarr not configured")
-            return jsonify({"configured": False, "connected": False})
-        
-        # Test connection if enabled
-        connected = False
-        if enabled:
-            test_result = test_connection(api_url, api_key, 5)  # Short timeout for status checks
-            connected = test_result['success']
-        
-        return jsonify({
-            "configured": True,
-            "connected": connected,
-            "enabled": enabled
-        })
+            status = {"configured": False, "connected": False}
+        else:
+            # Test connection if enabled
+            connected = False
+            if enabled:
+                connected = _get_connection_status(api_url, api_key)
+            
+            status = {
+                "configured": True,
+                "connected": connected,
+                "enabled": enabled
+            }
+        
+        body = orjson.dumps(status)
+        _status_cache['body'] = body
+        _status_cache['timestamp'] = time.time()
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         prowlarr_logger.error(f"Error getting Prowlarr status: {str(e)}")
-        return jsonify({"configured": False, "connected": False, "error": str(e)})
+        return _json({"configured": False, "connected": False, "error": str(e)})
 
 @prowlarr_bp.route('/indexers', methods=['GET'])
 def get_prowlarr_indexers():
     """Get Prowlarr indexers list quickly (no heavy statistics)"""
     try:
-        settings = load_settings("prowlarr")
+        settings = _get_prowlarr_settings()
         
-        api_url = settings.get("api_url", "").strip()
-        api_key = settings.get("api_key", "").strip()
-        enabled = settings.get("enabled", True)
+        api_url = settings['api_url']
+        api_key = settings['api_key']
+        enabled = settings['enabled']
         
         if not api_url or not api_key or not enabled:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Prowlarr is not configured or enabled'
             }), 400
         
-        # Clean URL
-        if not api_url.startswith(('http://', 'https://')):
-            api_url = f'http://{api_url}'
+        base_url = settings['base_url']
         
         headers = {'X-Api-Key': api_key}
+        verify_ssl = get_ssl_verify_setting()
         
         try:
             # Get indexers information and their status
-            indexers_url = f"{api_url.rstrip('/')}/api/v1/indexer"
-            indexers_response = requests.get(indexers_url, headers=headers, timeout=5)
+            indexers_url = f"{base_url}/api/v1/indexer"
+            indexers_response = session.get(indexers_url, headers=headers, timeout=5, verify=verify_ssl)
             
             # Get indexer status information
-            status_url = f"{api_url.rstrip('/')}/api/v1/indexerstatus"
-            status_response = requests.get(status_url, headers=headers, timeout=5)
+            status_url = f"{base_url}/api/v1/indexerstatus"
+            status_response = session.get(status_url, headers=headers, timeout=5, verify=verify_ssl)
             
             if indexers_response.status_code == 200:
-                indexers = indexers_response.json()
+                indexers = orjson.loads(indexers_response.content)
                 
                 # Build status lookup by indexer ID
                 status_lookup = {}
                 if status_response.status_code == 200:
-                    status_data = status_response.json()
+                    status_data = orjson.loads(status_response.content)
                     for status in status_data:
                         indexer_id = status.get('indexerId')
                         if indexer_id:
@@ -211,39 +350,30 @@ def get_prowlarr_indexers():
                 failed_indexers = []
                 
                 for indexer in indexers:
+                    indexer_id = indexer.get('id')
                     indexer_info = {
                         'name': indexer.get('name', 'Unknown'),
                         'protocol': indexer.get('protocol', 'unknown'),
-                        'id': indexer.get('id')
+                        'id': indexer_id
                     }
                     
-                    indexer_id = indexer.get('id')
-                    is_enabled = indexer.get('enable', False)
-                    
                     # Get status information for this indexer
-                    status_info = status_lookup.get(indexer_id, {})
-                    disabled_till = status_info.get('disabledTill')
-                    recent_failure = status_info.get('mostRecentFailure')
+                    status_info = status_lookup.get(indexer_id) or _EMPTY_DICT
                     
-                    if not is_enabled:
-                        # Explicitly disabled indexers
-                        failed_indexers.append(indexer_info)
-                    elif disabled_till:
-                        # Temporarily disabled due to failures
+                    if not indexer.get('enable', False) or status_info.get('disabledTill'):
+                        # Explicitly disabled, or temporarily disabled due to failures
                         failed_indexers.append(indexer_info)
-                    elif recent_failure:
+                    elif status_info.get('mostRecentFailure'):
                         # Has recent failures but still enabled - consider it throttled/problematic
                         throttled_indexers.append(indexer_info)
+                    elif (indexer.get('capabilities') or _EMPTY_DICT).get('limitsexceeded', False):
+                        # Rate limited
+                        throttled_indexers.append(indexer_info)
                     else:
-                        # Check for rate limiting
-                        capabilities = indexer.get('capabilities', {})
-                        if capabilities.get('limitsexceeded', False):
-                            throttled_indexers.append(indexer_info)
-                        else:
-                            # Enabled, no failures, no rate limits = active
-                            active_indexers.append(indexer_info)
+                        # Enabled, no failures, no rate limits = active
+                        active_indexers.append(indexer_info)
                 
-                return jsonify({
+                return _json({
                     'success': True,
                     'indexer_details': {
                         'active': active_indexers,
@@ -252,52 +382,117 @@ def get_prowlarr_indexers():
                     }
                 })
             else:
-                return jsonify({
+                return _json({
                     'success': False,
                     'error': f'Failed to get indexers (HTTP {indexers_response.status_code})'
                 }), 500
                 
         except requests.exceptions.Timeout:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Connection timeout'
             }), 504
         except requests.exceptions.ConnectionError:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Connection refused'
             }), 503
         except Exception as e:
             prowlarr_logger.error(f"Error getting indexers: {str(e)}")
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': f'Error getting indexers: {str(e)}'
             }), 500
         
     except Exception as e:
         prowlarr_logger.error(f"Failed to get Prowlarr indexers: {str(e)}")
-        return jsonify({
+        return _json({
             'success': False,
             'error': f'Failed to get Prowlarr indexers: {str(e)}'
         }), 500
 
+def _read_capped_json(response, max_bytes):
+    """Decode a streamed JSON response, returning None if the body is larger than max_bytes"""
+    try:
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            return None
+        
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body.extend(chunk)
+            if len(body) > max_bytes:
+                return None
+        return orjson.loads(body)
+    finally:
+        response.close()
+
+def _fetch_history_records(base_url, headers, since_date, verify_ssl):
+    """Fetch history records since the given date, falling back to the paged history endpoint"""
+    history_since_url = f"{base_url}/api/v1/history/since"
+    params = {'date': since_date}
+    
+    history_response = session.get(history_since_url, headers=headers, timeout=15, params=params, verify=verify_ssl, stream=True)
+    
+    if history_response.status_code == 200:
+        # /history/since returns an array directly, not a paged response
+        all_records = _read_capped_json(history_response, HISTORY_MAX_BYTES)
+        if all_records is not None:
+            prowlarr_logger.debug(f"Retrieved {len(all_records)} history records from /history/since endpoint")
+            return all_records
+        prowlarr_logger.warning(f"/history/since response exceeded {HISTORY_MAX_BYTES} bytes, falling back to regular history endpoint")
+    else:
+        # Fallback to regular history endpoint if /since is not available
+        history_response.close()
+        prowlarr_logger.debug(f"/history/since failed with status {history_response.status_code}, falling back to regular history endpoint")
+    
+    history_url = f"{base_url}/api/v1/history"
+    params = {
+        'pageSize': 200,  # Newest first and cut at the window below, so one modest page covers it
+        'sortKey': 'date',
+        'sortDirection': 'descending'
+    }
+    
+    fallback_response = session.get(history_url, headers=headers, timeout=15, params=params, verify=verify_ssl, stream=True)
+    if fallback_response.status_code != 200:
+        fallback_response.close()
+        return []
+    
+    fallback_data = _read_capped_json(fallback_response, HISTORY_MAX_BYTES)
+    if fallback_data is None:
+        prowlarr_logger.warning(f"History response exceeded {HISTORY_MAX_BYTES} bytes, skipping history statistics")
+        return []
+    
+    page_records = fallback_data.get('records', [])
+    
+    # Records are sorted newest first, so stop at the first one before the requested window
+    since_prefix = since_date[:10]
+    all_records = []
+    for record in page_records:
+        record_date = record.get('date') or ''
+        if record_date[:10] < since_prefix:
+            break
+        all_records.append(record)
+    
+    prowlarr_logger.debug(f"Fallback: Retrieved {len(page_records)} history records from regular endpoint, {len(all_records)} since {since_prefix}")
+    return all_records
+
 def _fetch_detailed_stats():
     """Fetch detailed statistics from Prowlarr API (used by background cache update)"""
     try:
-        settings = load_settings("prowlarr")
+        settings = _get_prowlarr_settings()
         
-        api_url = settings.get("api_url", "").strip()
-        api_key = settings.get("api_key", "").strip()
-        enabled = settings.get("enabled", True)
+        api_url = settings['api_url']
+        api_key = settings['api_key']
+        enabled = settings['enabled']
         
         if not api_url or not api_key or not enabled:
             return None
         
-        # Clean URL
-        if not api_url.startswith(('http://', 'https://')):
-            api_url = f'http://{api_url}'
+        base_url = settings['base_url']
         
         headers = {'X-Api-Key': api_key}
+        verify_ssl = get_ssl_verify_setting()
         
         # Initialize stats
         stats = {
@@ -313,52 +508,42 @@ def _fetch_detailed_stats():
         
         try:
             # Check connection first
-            status_url = f"{api_url.rstrip('/')}/api/v1/system/status"
-            status_response = requests.get(status_url, headers=headers, timeout=10)
+            status_url = f"{base_url}/api/v1/system/status"
+            status_response = session.get(status_url, headers=headers, timeout=10, verify=verify_ssl)
             
             if status_response.status_code == 200:
                 stats['connected'] = True
                 
-                # Get API history/usage statistics using the optimized /since endpoint
+                # Calculate the UTC day boundaries once from a single clock read
+                now = time.time()
+                today_str = time.strftime('%Y-%m-%d', time.gmtime(now))
+                yesterday_str = time.strftime('%Y-%m-%d', time.gmtime(now - SECONDS_PER_DAY))
+                tomorrow_str = time.strftime('%Y-%m-%d', time.gmtime(now + SECONDS_PER_DAY))
+                
+                # Use the /history/since endpoint for efficient date-based filtering
+                # This gets ALL records since yesterday without pagination limits
+                since_date = f"{yesterday_str}T00:00:00.000000Z"
+                
+                # Use indexerstats endpoint with date filtering for accurate daily statistics
+                today_start = f"{today_str}T00:00:00.000000Z"
+                today_end = f"{tomorrow_str}T00:00:00.000000Z"
+                
+                indexerstats_url = f"{base_url}/api/v1/indexerstats"
+                indexerstats_params = {
+                    'startDate': today_start,
+                    'endDate': today_end
+                }
+                
+                # History and indexer stats are independent, so fetch them concurrently
+                prowlarr_logger.debug(f"Fetching history since {since_date} and indexer stats for today: {today_start} to {today_end}")
+                history_future = _stats_executor.submit(_fetch_history_records, base_url, headers, since_date, verify_ssl)
+                indexerstats_future = _stats_executor.submit(
+                    session.get, indexerstats_url, headers=headers, timeout=15, params=indexerstats_params, verify=verify_ssl
+                )
+                
+                # Get API history/usage statistics
                 try:
-                    # Calculate date range for today and yesterday
-                    from datetime import datetime, timedelta
-                    now = datetime.utcnow()
-                    today = now.date()
-                    yesterday = today - timedelta(days=1)
-                    
-                    # Use the /history/since endpoint for efficient date-based filtering
-                    # This gets ALL records since yesterday without pagination limits
-                    yesterday_start = datetime.combine(yesterday, datetime.min.time())
-                    since_date = yesterday_start.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-                    
-                    history_since_url = f"{api_url.rstrip('/')}/api/v1/history/since"
-                    params = {'date': since_date}
-                    
-                    prowlarr_logger.debug(f"Fetching history since {since_date} using /history/since endpoint")
-                    history_response = requests.get(history_since_url, headers=headers, timeout=15, params=params)
-                    
-                    all_records = []
-                    if history_response.status_code == 200:
-                        # /history/since returns an array directly, not a paged response
-                        all_records = history_response.json()
-                        prowlarr_logger.debug(f"Retrieved {len(all_records)} history records from /history/since endpoint")
-                    else:
-                        # Fallback to regular history endpoint if /since is not available
-                        prowlarr_logger.debug(f"/history/since failed with status {history_response.status_code}, falling back to regular history endpoint")
-                        
-                        history_url = f"{api_url.rstrip('/')}/api/v1/history"
-                        params = {
-                            'pageSize': 500,  # Larger page size for fallback
-                            'sortKey': 'date',
-                            'sortDirection': 'descending'
-                        }
-                        
-                        fallback_response = requests.get(history_url, headers=headers, timeout=15, params=params)
-                        if fallback_response.status_code == 200:
-                            fallback_data = fallback_response.json()
-                            all_records = fallback_data.get('records', [])
-                            prowlarr_logger.debug(f"Fallback: Retrieved {len(all_records)} history records from regular endpoint")
+                    all_records = history_future.result()
                     
                     if all_records:
                         # Total records gives us approximate API call count
@@ -376,10 +561,10 @@ def _fetch_detailed_stats():
                         
                         prowlarr_logger.debug(f"Processing {len(all_records)} history records for date analysis")
                         
+                        # Record dates are ISO-8601 UTC strings, so the YYYY-MM-DD prefix is enough to bucket them
                         for record in all_records:
                             try:
-                                # Parse the date from the record
-                                record_date = datetime.fromisoformat(record.get('date', '').replace('Z', '+00:00')).date()
+                                date_prefix = record.get('date', '')[:10]
                                 is_successful = record.get('successful', False)
                                 indexer_id = record.get('indexerId')
                                 
@@ -392,7 +577,7 @@ def _fetch_detailed_stats():
                                         'failed_today': 0
                                     }
                                 
-                                if record_date == today:
+                                if date_prefix == today_str:
                                     searches_today += 1
                                     if is_successful:
                                         successful_searches += 1
@@ -407,12 +592,12 @@ def _fetch_detailed_stats():
                                         else:
                                             indexer_daily_stats[indexer_id]['failed_today'] += 1
                                             
-                                elif record_date == yesterday:
+                                elif date_prefix == yesterday_str:
                                     searches_yesterday += 1
                                     if indexer_id:
                                         indexer_daily_stats[indexer_id]['searches_yesterday'] += 1
                                         
-                            except (ValueError, AttributeError):
+                            except (TypeError, AttributeError):
                                 continue
                         
                         stats['searches_today'] = searches_today
@@ -428,21 +613,10 @@ def _fetch_detailed_stats():
                 
                 # Get indexer performance statistics with date filtering for today's data
                 try:
-                    # Use indexerstats endpoint with date filtering for accurate daily statistics
-                    today_start = datetime.combine(today, datetime.min.time())
-                    today_end = datetime.combine(today + timedelta(days=1), datetime.min.time())
-                    
-                    indexerstats_url = f"{api_url.rstrip('/')}/api/v1/indexerstats"
-                    indexerstats_params = {
-                        'startDate': today_start.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-                        'endDate': today_end.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-                    }
-                    
-                    prowlarr_logger.debug(f"Fetching indexer stats for today: {today_start} to {today_end}")
-                    indexerstats_response = requests.get(indexerstats_url, headers=headers, timeout=15, params=indexerstats_params)
+                    indexerstats_response = indexerstats_future.result()
                     
                     if indexerstats_response.status_code == 200:
-                        indexerstats_data = indexerstats_response.json()
+                        indexerstats_data = orjson.loads(indexerstats_response.content)
                         indexer_stats = indexerstats_data.get('indexers', [])
                         
                         if indexer_stats:
@@ -494,11 +668,12 @@ def _fetch_detailed_stats():
                                 for idx_id, idx_data in stats.get('indexer_daily_stats', {}).items():
                                     prowlarr_logger.debug(f"Indexer {idx_id}: {idx_data.get('searches_today', 0)} searches today")
                             
-                            # Calculate average response time
-                            total_response_time = 0
-                            total_queries = 0
+                            # Calculate average response time from parallel query/response-time columns
+                            performance_queries = []
+                            performance_response_times = []
                             indexer_performance = []
                             individual_indexer_stats = {}
+                            indexer_daily_stats = stats.get('indexer_daily_stats', _EMPTY_DICT)
                             
                             for indexer_stat in indexer_stats:
                                 response_time = indexer_stat.get('averageResponseTime', 0)
@@ -508,12 +683,7 @@ def _fetch_detailed_stats():
                                 indexer_name = indexer_stat.get('indexerName', 'Unknown')
                                 
                                 # Get daily stats for this indexer (now updated with consistent indexerstats data)
-                                daily_stats = stats.get('indexer_daily_stats', {}).get(indexer_id, {
-                                    'searches_today': 0,
-                                    'searches_yesterday': 0,
-                                    'successful_today': 0,
-                                    'failed_today': 0
-                                })
+                                daily_stats = indexer_daily_stats.get(indexer_id, _EMPTY_DAILY_STATS)
                                 
                                 # Use indexerstats numberOfQueries as the authoritative source for today's searches
                                 indexer_searches_today = queries  # This comes from indexerstats API
@@ -538,19 +708,21 @@ def _fetch_detailed_stats():
                                 }
                                 
                                 if queries > 0:
-                                    total_response_time += response_time * queries
-                                    total_queries += queries
+                                    performance_queries.append(queries)
+                                    performance_response_times.append(response_time)
                                     indexer_performance.append(indexer_data)
                                 
                                 # Store individual stats by name for easy lookup
                                 individual_indexer_stats[indexer_name] = indexer_data
                             
                             # Calculate overall average response time (weighted average across all indexers)
+                            total_queries = sum(performance_queries)
+                            total_response_time = sum(map(mul, performance_response_times, performance_queries))
                             avg_response_time = round(total_response_time / max(total_queries, 1), 0)
                             stats['avg_response_time'] = avg_response_time
                             
                             prowlarr_logger.debug(f"Calculated weighted average response time: {avg_response_time}ms from {len(indexer_stats)} indexers")
-                            stats['indexer_performance'] = sorted(indexer_performance, key=lambda x: x['queries'], reverse=True)
+                            stats['indexer_performance'] = heapq.nlargest(TOP_INDEXERS_LIMIT, indexer_performance, key=itemgetter('queries'))
                             stats['individual_indexer_stats'] = individual_indexer_stats
                         
                 except Exception as e:
@@ -565,61 +737,141 @@ def _fetch_detailed_stats():
         prowlarr_logger.error(f"Failed to fetch detailed stats: {str(e)}")
         return None
 
+def _adaptive_cache_duration(elapsed):
+    """Scale the stats cache lifetime with how long Prowlarr took to answer"""
+    return max(STATS_CACHE_MIN_DURATION, min(STATS_CACHE_MAX_DURATION, elapsed * 10 + 30))
+
 def _update_stats_cache():
     """Update the statistics cache in background"""
     global _stats_cache
     
     try:
+        start_time = time.time()
         new_stats = _fetch_detailed_stats()
+        elapsed = time.time() - start_time
         
         with _cache_lock:
             if new_stats:
                 _stats_cache['data'] = new_stats
                 _stats_cache['timestamp'] = time.time()
-                prowlarr_logger.debug("Statistics cache updated successfully")
+                _stats_cache['cache_duration'] = _adaptive_cache_duration(elapsed)
+                prowlarr_logger.debug(f"Statistics cache updated successfully (fetch took {elapsed:.1f}s, next refresh in {_stats_cache['cache_duration']:.0f}s)")
             else:
                 prowlarr_logger.debug("Failed to update statistics cache")
                 
     except Exception as e:
         prowlarr_logger.error(f"Error updating stats cache: {str(e)}")
+    finally:
+        with _cache_lock:
+            _stats_cache['refreshing'] = False
+
+def _stats_refresh_loop():
+    """Background worker that refreshes the statistics cache whenever a refresh is requested"""
+    while True:
+        _refresh_queue.get()
+        _update_stats_cache()
+
+def request_stats_refresh():
+    """
+    Queue a background refresh of the statistics cache if it is stale.
+    
+    This is the only way the cache is refreshed in the background, so request
+    handlers and the background refresher share one in-flight flag and TTL.
+    
+    Returns:
+        bool: True if a refresh was queued, False if the cache is fresh or a refresh is already running
+    """
+    global _refresh_worker
+    
+    with _cache_lock:
+        is_stale = time.time() - _stats_cache['timestamp'] > _stats_cache['cache_duration']
+        if not is_stale or _stats_cache['refreshing']:
+            return False
+        _stats_cache['refreshing'] = True
+        
+        # Single long-lived worker for background statistics refreshes, started on first use
+        if _refresh_worker is None or not _refresh_worker.is_alive():
+            _refresh_worker = threading.Thread(target=_stats_refresh_loop, name="prowlarr-stats-refresh", daemon=True)
+            try:
+                _refresh_worker.start()
+            except Exception as e:
+                _refresh_worker = None
+                _stats_cache['refreshing'] = False
+                prowlarr_logger.error(f"Could not start stats refresh worker: {e}")
+                return False
+    
+    try:
+        _refresh_queue.put_nowait(True)
+    except queue.Full:
+        # A refresh is already queued
+        pass
+    return True
 
 @prowlarr_bp.route('/stats', methods=['GET'])
 def get_prowlarr_stats():
     """Get cached Prowlarr statistics"""
-    global _stats_cache
+    global _stats_cache, _inflight_event
     
     try:
+        current_time = time.time()
+        
+        # Only hold the lock while reading/flagging the cache, never across network calls
         with _cache_lock:
-            current_time = time.time()
+            cached_data = _stats_cache['data']
+            cache_timestamp = _stats_cache['timestamp']
+            is_stale = current_time - cache_timestamp > _stats_cache['cache_duration']
             
-            # Check if cache is expired or empty
-            if (_stats_cache['data'] is None or 
-                current_time - _stats_cache['timestamp'] > _stats_cache['cache_duration']):
-                
-                # Start background update if cache is expired
-                if _stats_cache['data'] is None:
-                    # First time - fetch synchronously but with shorter timeout
-                    prowlarr_logger.debug("First time stats fetch - getting initial data")
-                    initial_stats = _fetch_detailed_stats()
-                    if initial_stats:
-                        _stats_cache['data'] = initial_stats
-                        _stats_cache['timestamp'] = current_time
-                else:
-                    # Cache expired - start background update
-                    threading.Thread(target=_update_stats_cache, daemon=True).start()
             
-            # Return cached data (or None if no cache available)
-            cached_data = _stats_cache['data']
+            # Nothing cached yet - let the first caller fetch while the rest wait for it
+            fetch_event = None
+            is_fetch_leader = False
+            if cached_data is None:
+                if _inflight_event is None:
+                    _inflight_event = threading.Event()
+                    is_fetch_leader = True
+                fetch_event = _inflight_event
+        
+        # Cache expired - serve the stale data and refresh once in the background
+        if cached_data is not None and is_stale:
+            request_stats_refresh()
+        
+        if is_fetch_leader:
+            # First time - nothing to serve yet, so fetch synchronously
+            prowlarr_logger.debug("First time stats fetch - getting initial data")
+            try:
+                start_time = time.time()
+                initial_stats = _fetch_detailed_stats()
+                elapsed = time.time() - start_time
+                if initial_stats:
+                    with _cache_lock:
+                        _stats_cache['data'] = initial_stats
+                        _stats_cache['timestamp'] = time.time()
+                        _stats_cache['cache_duration'] = _adaptive_cache_duration(elapsed)
+            finally:
+                with _cache_lock:
+                    _inflight_event = None
+                fetch_event.set()
+        elif fetch_event is not None:
+            prowlarr_logger.debug("Waiting for in-flight initial stats fetch")
+            fetch_event.wait(timeout=30)
+        
+        if fetch_event is not None:
+            with _cache_lock:
+                cached_data = _stats_cache['data']
+                cache_timestamp = _stats_cache['timestamp']
+            current_time = time.time()
+            is_stale = False
         
         if cached_data:
-            return jsonify({
+            return _json({
                 'success': True,
                 'stats': cached_data,
                 'cached': True,
-                'cache_age': int(current_time - _stats_cache['timestamp'])
+                'stale': is_stale,
+                'cache_age': int(current_time - cache_timestamp)
             })
         else:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Statistics not available',
                 'cached': False
@@ -627,7 +879,7 @@ def get_prowlarr_stats():
         
     except Exception as e:
         prowlarr_logger.error(f"Failed to get cached stats: {str(e)}")
-        return jsonify({
+        return _json({
             'success': False,
             'error': f'Failed to get statistics: {str(e)}'
         }), 500
@@ -642,7 +894,7 @@ def get_indexer_stats(indexer_name):
             cached_data = _stats_cache['data']
         
         if not cached_data or 'individual_indexer_stats' not in cached_data:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Indexer statistics not available'
             }), 503
@@ -650,14 +902,14 @@ def get_indexer_stats(indexer_name):
         individual_stats = cached_data['individual_indexer_stats']
         
         if indexer_name not in individual_stats:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': f'Statistics for indexer "{indexer_name}" not found'
             }), 404
         
         indexer_data = individual_stats[indexer_name]
         
-        return jsonify({
+        return _json({
             'success': True,
             'indexer_name': indexer_name,
             'stats': {
@@ -672,7 +924,7 @@ def get_indexer_stats(indexer_name):
         
     except Exception as e:
         prowlarr_logger.error(f"Failed to get indexer stats for {indexer_name}: {str(e)}")
-        return jsonify({
+        return _json({
             'success': False,
             'error': f'Failed to get indexer statistics: {str(e)}'
         }), 500
@@ -686,21 +938,21 @@ def test_connection_endpoint():
     api_timeout = data.get('api_timeout', 30)
 
     if not api_url or not api_key:
-        return jsonify({"success": False, "message": "API URL and API Key are required"}), 400
+        return _json({"success": False, "message": "API URL and API Key are required"}), 400
     
     result = test_connection(api_url, api_key, api_timeout)
     
     if result["success"]:
-        return jsonify(result)
+        return _json(result)
     else:
         # Return appropriate HTTP status code based on the error
         if "Invalid API key" in result["message"]:
-            return jsonify(result), 401
+            return _json(result), 401
         elif "Access forbidden" in result["message"]:
-            return jsonify(result), 403
+            return _json(result), 403
         elif "not found" in result["message"] or "DNS resolution failed" in result["message"]:
-            return jsonify(result), 404
+            return _json(result), 404
         elif "timed out" in result["message"]:
-            return jsonify(result), 504
+            return _json(result), 504
         else:
-            return jsonify(result), 500 
\ No newline at end of file
+            return _json(result), 500
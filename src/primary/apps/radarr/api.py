@@ -5,6 +5,7 @@ Handles all communication with the Radarr API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import sys
 import time
@@ -17,8 +18,16 @@ from src.primary.settings_manager import get_ssl_verify_setting
 # Get logger for the Radarr app
 radarr_logger = get_logger("radarr")
 
+# Connections kept open per Radarr host. Up to 8 upgrade tagging workers
+# (upgrade.UPGRADE_TAG_WORKERS) share the session with the hunt cycle thread and
+# the status page's connection checks; requests' default of 10 would make the
+# overflow open and discard a fresh connection on every call during tagging.
+SESSION_POOL_MAXSIZE = 16
+
 # Use a session for better performance
 session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_maxsize=SESSION_POOL_MAXSIZE))
+session.mount("https://", HTTPAdapter(pool_maxsize=SESSION_POOL_MAXSIZE))
 
 def arr_request(api_url: str, api_key: str, api_timeout: int, endpoint: str, method: str = "GET", data: Dict = None, params: Dict = None, count_api: bool = True) -> Any:
     """
@@ -416,7 +425,7 @@ def check_connection(api_url: str, api_key: str, api_timeout: int) -> bool:
         base_url = api_url.rstrip('/')
         full_url = f"{base_url}/api/v3/system/status"
         
-        response = requests.get(full_url, headers={"X-Api-Key": api_key}, timeout=api_timeout)
+        response = session.get(full_url, headers={"X-Api-Key": api_key}, timeout=api_timeout)
         response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
         radarr_logger.debug("Successfully connected to Radarr.")
         return True
@@ -540,6 +549,41 @@ def add_tag_to_movie(api_url: str, api_key: str, api_timeout: int, movie_id: int
         radarr_logger.error(f"Error adding tag {tag_id} to movie {movie_id}: {e}")
         return False
 
+def add_tag_to_movies(api_url: str, api_key: str, api_timeout: int, movie_ids: List[int], tag_id: int) -> bool:
+    """
+    Add a tag to several movies in Radarr with a single movie editor request.
+    
+    Args:
+        api_url: The base URL of the Radarr API
+        api_key: The API key for authentication
+        api_timeout: Timeout for the API request
+        movie_ids: The IDs of the movies to tag
+        tag_id: The ID of the tag to add
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if not movie_ids:
+        return True
+    
+    try:
+        data = {
+            "movieIds": movie_ids,
+            "tags": [tag_id],
+            "applyTags": "add"
+        }
+        response = arr_request(api_url, api_key, api_timeout, "movie/editor", method="PUT", data=data, count_api=False)
+        if response is not None:
+            radarr_logger.debug(f"Successfully added tag {tag_id} to {len(movie_ids)} movies")
+            return True
+        else:
+            radarr_logger.error(f"Failed to add tag {tag_id} to movies {movie_ids}")
+            return False
+            
+    except Exception as e:
+        radarr_logger.error(f"Error adding tag {tag_id} to movies {movie_ids}: {e}")
+        return False
+
 def tag_processed_movie(api_url: str, api_key: str, api_timeout: int, movie_id: int, tag_label: str = "huntarr-missing") -> bool:
     """
     Tag a movie in Radarr with the specified tag.
@@ -110,6 +110,7 @@ def process_missing_movies(
     api_timeout = get_advanced_setting("api_timeout", 120)  # Use database value
     monitored_only = app_settings.get("monitored_only", True)
     skip_future_releases = app_settings.get("skip_future_releases", True)
+    process_no_release_dates = app_settings.get("process_no_release_dates", False)
     # skip_movie_refresh setting removed as it was a performance bottleneck
     hunt_missing_movies = app_settings.get("hunt_missing_movies", 0)
     
@@ -180,7 +181,7 @@ def process_missing_movies(
                 else:
                     # Could not parse release date, treat as no date
                     radarr_logger.debug(f"Movie ID {movie_id} ('{movie_title}') has unparseable releaseDate '{release_date_str}' - treating as no release date")
-                    if app_settings.get('process_no_release_dates', False):
+                    if process_no_release_dates:
                         radarr_logger.debug(f"Movie ID {movie_id} ('{movie_title}') has no valid release date but process_no_release_dates is enabled - including in search")
                         filtered_movies.append(movie)
                     else:
@@ -188,7 +189,7 @@ def process_missing_movies(
                         no_date_count += 1
             else:
                 # No release date available at all
-                if app_settings.get('process_no_release_dates', False):
+                if process_no_release_dates:
                     radarr_logger.debug(f"Movie ID {movie_id} ('{movie_title}') has no releaseDate field but process_no_release_dates is enabled - including in search")
                     filtered_movies.append(movie)
                 else:
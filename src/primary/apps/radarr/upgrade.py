@@ -7,52 +7,96 @@ Handles searching for movies that need quality upgrades in Radarr
 import time
 import random
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Set, Callable
 from src.primary.utils.logger import get_logger
 from src.primary.apps.radarr import api as radarr_api
-from src.primary.stats_manager import increment_stat, increment_stat_only, check_hourly_cap_exceeded
-from src.primary.stateful_manager import is_processed, add_processed_id
-from src.primary.utils.history_utils import log_processed_media
+from src.primary.stats_manager import increment_stat, increment_stat_only, increment_hourly_cap, get_hourly_cap_status
+from src.primary.stateful_manager import is_processed_bulk, add_processed_ids
+from src.primary.utils.history_utils import log_processed_media_bulk
 from src.primary.settings_manager import get_advanced_setting, load_settings
 from src.primary.utils.date_utils import parse_date
 
 # Get logger for the app
 radarr_logger = get_logger("radarr")
 
-def should_delay_movie_search(release_date_str: str, delay_days: int) -> bool:
+_UTC = datetime.timezone.utc
+
+def _parse_release_date(date_str: str):
     """
-    Check if a movie search should be delayed based on its release date.
+    Parse a Radarr release date, using fromisoformat for the usual UTC 'Z' form.
     
-    Args:
-        release_date_str: Movie release date in ISO format (e.g., '2024-01-15T00:00:00Z')
-        delay_days: Number of days to delay search after release date
-        
-    Returns:
-        True if search should be delayed, False if ready to search
+    Anything else goes through the general parse_date formats, and dates without
+    a timezone are taken as UTC so they compare against the cycle's UTC thresholds.
     """
-    if delay_days <= 0:
-        return False  # No delay configured
-        
-    if not release_date_str:
-        return False  # No release date, don't delay (process immediately)
-        
-    try:
-        # Parse the release date
-        release_date = parse_date(release_date_str)
-        if not release_date:
-            return False  # Invalid date, don't delay
-            
-        current_time = datetime.datetime.now(datetime.timezone.utc)
-        
-        # Calculate when search should start (release date + delay)
-        search_start_time = release_date + datetime.timedelta(days=delay_days)
-        
-        # Return True if we should still delay (current time < search start time)
-        return current_time < search_start_time
-        
-    except Exception as e:
-        radarr_logger.warning(f"Could not parse release date '{release_date_str}' for delay calculation: {e}")
-        return False  # Don't delay if we can't parse the date
+    if isinstance(date_str, str) and date_str.endswith('Z'):
+        try:
+            return datetime.datetime.fromisoformat(date_str[:-1] + '+00:00')
+        except ValueError:
+            pass
+    parsed = parse_date(date_str)
+    if parsed and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=_UTC)
+    return parsed
+
+# Release dates repeat across movies and cycles, so remember parsed results
+_parse_date_cached = functools.lru_cache(maxsize=4096)(_parse_release_date)
+
+# Default number of cutoff unmet movies fetched per cycle
+UPGRADE_FETCH_PAGE_SIZE = 250
+
+# Maximum number of movies tagged in Radarr at the same time
+UPGRADE_TAG_WORKERS = 8
+
+def _random_subset(items: List[Any], k: int) -> List[Any]:
+    """
+    Pick k random items from a list.
+    
+    Small picks use random.sample; when k is a large share of the list, a
+    Fisher-Yates shuffle over the indices is stopped after k swaps instead.
+    """
+    n = len(items)
+    if k * 4 < n:
+        return random.sample(items, k)
+    idx = list(range(n))
+    for i in range(k):
+        j = random.randrange(i, n)
+        idx[i], idx[j] = idx[j], idx[i]
+    return [items[i] for i in idx[:k]]
+
+def _tag_upgraded_movies(api_url: str, api_key: str, api_timeout: int, movies: List[Dict[str, Any]], custom_tag: str) -> None:
+    """
+    Tag movies whose upgrade search was triggered with the configured upgrade tag.
+    
+    Movies that already carry the tag are skipped, and the rest are tagged with one
+    movie editor request, falling back to tagging them one at a time.
+    """
+    tag_id = radarr_api.get_or_create_tag(api_url, api_key, api_timeout, custom_tag)
+    if tag_id is None:
+        radarr_logger.warning("Failed to get or create tag '%s' in Radarr", custom_tag)
+        return
+    
+    # The cutoff unmet records already include each movie's tags
+    untagged_ids = [movie["id"] for movie in movies if tag_id not in (movie.get("tags") or [])]
+    if not untagged_ids:
+        radarr_logger.debug("All %s movies already tagged with '%s'", len(movies), custom_tag)
+        return
+    
+    if radarr_api.add_tag_to_movies(api_url, api_key, api_timeout, untagged_ids, tag_id):
+        radarr_logger.debug("Tagged movies %s with '%s'", untagged_ids, custom_tag)
+        return
+    
+    # Tagging one movie needs a fetch and update, so run those concurrently
+    def tag_one(movie_id):
+        try:
+            if radarr_api.add_tag_to_movie(api_url, api_key, api_timeout, movie_id, tag_id):
+                radarr_logger.debug("Tagged movie %s with '%s'", movie_id, custom_tag)
+        except Exception as e:
+            radarr_logger.warning("Failed to tag movie %s with '%s': %s", movie_id, custom_tag, e)
+    
+    with ThreadPoolExecutor(max_workers=min(UPGRADE_TAG_WORKERS, len(untagged_ids))) as executor:
+        executor.map(tag_one, untagged_ids)
 
 def process_cutoff_upgrades(
     app_settings: Dict[str, Any],
@@ -69,11 +113,6 @@ def process_cutoff_upgrades(
         True if any movies were processed for upgrades, False otherwise.
     """
     radarr_logger.info("Starting quality cutoff upgrades processing cycle for Radarr.")
-    processed_any = False
-    
-    # Load settings to check if tagging is enabled
-    radarr_settings = load_settings("radarr")
-    tag_processed_items = radarr_settings.get("tag_processed_items", True)
     
     # Extract necessary settings
     api_url = app_settings.get("api_url", "").strip()
@@ -82,7 +121,23 @@ def process_cutoff_upgrades(
     monitored_only = app_settings.get("monitored_only", True)
     # skip_movie_refresh setting removed as it was a performance bottleneck
     hunt_upgrade_movies = app_settings.get("hunt_upgrade_movies", 0)
+    if hunt_upgrade_movies <= 0:
+        radarr_logger.info("hunt_upgrade_movies is 0 - skipping quality cutoff upgrades for Radarr.")
+        return False
+    if not api_url or not api_key:
+        radarr_logger.warning("Radarr API URL or key is not set - skipping quality cutoff upgrades.")
+        return False
     skip_future_releases = app_settings.get("skip_future_releases", True)
+    process_no_release_dates = app_settings.get("process_no_release_dates", False)
+    
+    # Load settings to check if tagging is enabled
+    radarr_settings = load_settings("radarr")
+    tag_processed_items = radarr_settings.get("tag_processed_items", True)
+    if tag_processed_items:
+        from src.primary.settings_manager import get_custom_tag
+        custom_tag = get_custom_tag("radarr", "upgrade", "huntarr-upgraded")
+    else:
+        custom_tag = None
     
     # Use advanced settings from database for command operations
     command_wait_delay = get_advanced_setting("command_wait_delay", 1)
@@ -91,10 +146,13 @@ def process_cutoff_upgrades(
     # Get instance name - check for instance_name first, fall back to legacy "name" key if needed
     instance_name = app_settings.get("instance_name", app_settings.get("name", "Radarr Default"))
     
+    # Fetch a larger page so enough candidates survive filtering, at the same one request per cycle
+    page_size = app_settings.get("upgrade_fetch_page_size", UPGRADE_FETCH_PAGE_SIZE)
+    
     # Get movies eligible for upgrade
     radarr_logger.info("Retrieving movies eligible for cutoff upgrade...")
     upgrade_eligible_data = radarr_api.get_cutoff_unmet_movies_random_page(
-        api_url, api_key, api_timeout, monitored_only, count=50
+        api_url, api_key, api_timeout, monitored_only, count=page_size
     )
     
     if not upgrade_eligible_data:
@@ -103,156 +161,142 @@ def process_cutoff_upgrades(
         
     radarr_logger.info(f"Found {len(upgrade_eligible_data)} movies eligible for upgrade.")
 
-    # Skip future releases if enabled (matching missing movies logic)
+    # Both release date filters compare against the same clock reading
+    now = datetime.datetime.now(_UTC)
+    release_date_delay_days = app_settings.get("release_date_delay_days", 0)
+
     if skip_future_releases:
         radarr_logger.info("Filtering out future releases from upgrades...")
-        now = datetime.datetime.now(datetime.timezone.utc)
-        
-        filtered_movies = []
-        skipped_count = 0
-        no_date_count = 0
-        for movie in upgrade_eligible_data:
-            movie_id = movie.get('id')
-            movie_title = movie.get('title', 'Unknown Title')
-            release_date_str = movie.get('releaseDate')
-            
-            if release_date_str:
-                release_date = parse_date(release_date_str)
-                if release_date:
-                    if release_date > now:
-                        # Movie has a future release date, skip it
-                        radarr_logger.debug(f"Skipping future movie ID {movie_id} ('{movie_title}') for upgrade - releaseDate is in the future: {release_date}")
-                        skipped_count += 1
-                        continue
-                    else:
-                        # Movie release date is in the past, include it
-                        radarr_logger.debug(f"Movie ID {movie_id} ('{movie_title}') releaseDate is in the past: {release_date}, including in upgrade search")
-                        filtered_movies.append(movie)
-                else:
-                    # Could not parse release date, treat as no date
-                    radarr_logger.debug(f"Movie ID {movie_id} ('{movie_title}') has unparseable releaseDate '{release_date_str}' for upgrade - treating as no release date")
-                    if app_settings.get('process_no_release_dates', False):
-                        radarr_logger.debug(f"Movie ID {movie_id} ('{movie_title}') has no valid release date but process_no_release_dates is enabled - including in upgrade search")
-                        filtered_movies.append(movie)
-                    else:
-                        radarr_logger.debug(f"Skipping movie ID {movie_id} ('{movie_title}') for upgrade - no valid release date and process_no_release_dates is disabled")
-                        no_date_count += 1
-            else:
-                # No release date available at all
-                if app_settings.get('process_no_release_dates', False):
-                    radarr_logger.debug(f"Movie ID {movie_id} ('{movie_title}') has no releaseDate field but process_no_release_dates is enabled - including in upgrade search")
-                    filtered_movies.append(movie)
-                else:
-                    radarr_logger.debug(f"Skipping movie ID {movie_id} ('{movie_title}') for upgrade - no releaseDate field and process_no_release_dates is disabled")
-                    no_date_count += 1
-        
-        radarr_logger.info(f"Filtered out {skipped_count} future releases and {no_date_count} movies with no release dates from upgrades")
-        radarr_logger.debug(f"After filtering: {len(filtered_movies)} movies remaining from {len(upgrade_eligible_data)} original")
-        upgrade_eligible_data = filtered_movies
     else:
         radarr_logger.info("Skip future releases is disabled - processing all movies for upgrades regardless of release date")
-
-    # Apply release date delay if configured
-    release_date_delay_days = app_settings.get("release_date_delay_days", 0)
     if release_date_delay_days > 0:
         radarr_logger.info(f"Applying {release_date_delay_days}-day release date delay for upgrades...")
-        original_count = len(upgrade_eligible_data)
-        delayed_movies = []
-        delayed_count = 0
-        
-        for movie in upgrade_eligible_data:
-            movie_id = movie.get('id')
-            movie_title = movie.get('title', 'Unknown Title')
-            release_date_str = movie.get('releaseDate')
-            
-            if should_delay_movie_search(release_date_str, release_date_delay_days):
-                delayed_count += 1
-                radarr_logger.debug(f"Delaying upgrade search for movie ID {movie_id} ('{movie_title}') - released {release_date_str}, waiting {release_date_delay_days} days")
-            else:
-                delayed_movies.append(movie)
-        
-        upgrade_eligible_data = delayed_movies
-        if delayed_count > 0:
-            radarr_logger.info(f"Delayed {delayed_count} movies for upgrades due to {release_date_delay_days}-day release date delay setting.")
 
-    if not upgrade_eligible_data:
-        radarr_logger.info("No movies eligible for upgrade left to process after filtering future releases.")
-        return False
+    # Movies released after this cutoff are skipped, either as future releases or by the delay
+    release_cutoff = None
+    if skip_future_releases:
+        release_cutoff = now
+    if release_date_delay_days > 0:
+        delay_cutoff = now - datetime.timedelta(days=release_date_delay_days)
+        release_cutoff = delay_cutoff if release_cutoff is None else min(release_cutoff, delay_cutoff)
+    # Movies without a usable release date are only dropped by the future release filter
+    keep_no_date = process_no_release_dates or not skip_future_releases
+
+    # Stateful management is checked with one lookup covering the whole page
+    movie_keys = [str(movie.get("id")) for movie in upgrade_eligible_data]
+    processed_ids = is_processed_bulk("radarr", instance_name, movie_keys)
 
-    # Filter out already processed movies using stateful management
+    # Apply the future release, release date delay and already processed filters in one pass
     unprocessed_movies = []
-    for movie in upgrade_eligible_data:
-        movie_id = str(movie.get("id"))
-        if not is_processed("radarr", instance_name, movie_id):
-            unprocessed_movies.append(movie)
+    skipped_count = 0
+    no_date_count = 0
+    delayed_count = 0
+    already_processed_count = 0
+    for movie, movie_key in zip(upgrade_eligible_data, movie_keys):
+        movie_id, movie_title, release_date_str = movie.get('id'), movie.get('title', 'Unknown Title'), movie.get('releaseDate')
+        release_date = _parse_date_cached(release_date_str) if release_date_str else None
+
+        if release_date is None:
+            keep = keep_no_date
         else:
-            radarr_logger.debug(f"Skipping already processed movie ID: {movie_id}")
+            keep = release_cutoff is None or release_date <= release_cutoff
+
+        if not keep:
+            if release_date is None:
+                radarr_logger.debug("Skipping movie ID %s ('%s') for upgrade - no valid releaseDate '%s' and process_no_release_dates is disabled", movie_id, movie_title, release_date_str)
+                no_date_count += 1
+            elif skip_future_releases and release_date > now:
+                radarr_logger.debug("Skipping future movie ID %s ('%s') for upgrade - releaseDate is in the future: %s", movie_id, movie_title, release_date)
+                skipped_count += 1
+            else:
+                radarr_logger.debug("Delaying upgrade search for movie ID %s ('%s') - released %s, waiting %s days", movie_id, movie_title, release_date_str, release_date_delay_days)
+                delayed_count += 1
+            continue
+
+        # Filter out already processed movies using stateful management
+        if movie_key in processed_ids:
+            radarr_logger.debug("Skipping already processed movie ID: %s", movie_id)
+            already_processed_count += 1
+            continue
+
+        unprocessed_movies.append(movie)
+
+    if skip_future_releases:
+        radarr_logger.info(f"Filtered out {skipped_count} future releases and {no_date_count} movies with no release dates from upgrades")
+    if delayed_count > 0:
+        radarr_logger.info(f"Delayed {delayed_count} movies for upgrades due to {release_date_delay_days}-day release date delay setting.")
     
-    radarr_logger.info(f"Found {len(unprocessed_movies)} unprocessed movies for upgrade out of {len(upgrade_eligible_data)} total.")
+    radarr_logger.info(f"Found {len(unprocessed_movies)} unprocessed movies for upgrade out of {len(upgrade_eligible_data)} total ({already_processed_count} already processed).")
     
     if not unprocessed_movies:
-        radarr_logger.info("No upgradeable movies found to process (after filtering already processed). Skipping.")
+        radarr_logger.info("No upgradeable movies found to process after filtering. Skipping.")
         return False
         
     radarr_logger.info(f"Randomly selecting up to {hunt_upgrade_movies} movies for upgrade search.")
-    movies_to_process = random.sample(unprocessed_movies, min(hunt_upgrade_movies, len(unprocessed_movies)))
+    movies_to_process = _random_subset(unprocessed_movies, min(hunt_upgrade_movies, len(unprocessed_movies)))
         
     radarr_logger.info(f"Selected {len(movies_to_process)} movies to search for upgrades.")
-    processed_count = 0
-    processed_something = False
+    
+    if stop_check():
+        radarr_logger.info("Stop signal received, aborting Radarr upgrade cycle.")
+        return False
+    
+    # The hourly cap counts one hit per movie searched, even though the movies
+    # go out in a single command, so only search as many as the cap still allows
+    try:
+        cap_status = get_hourly_cap_status("radarr")
+        if "error" not in cap_status:
+            remaining = cap_status["remaining"]
+            if remaining <= 0:
+                radarr_logger.warning("🛑 Radarr API hourly limit reached - skipping upgrade search")
+                return False
+            if remaining < len(movies_to_process):
+                radarr_logger.warning(f"🛑 Radarr API hourly limit allows only {remaining} more searches - limiting upgrade search to {remaining} movies")
+                movies_to_process = movies_to_process[:remaining]
+    except Exception as e:
+        radarr_logger.error("Error checking hourly API cap: %s", e)
+        # Continue processing if cap check fails - safer than stopping
     
     for movie in movies_to_process:
-        if stop_check():
-            radarr_logger.info("Stop signal received, aborting Radarr upgrade cycle.")
-            break
-        
-        # Check API limit before processing each movie
-        try:
-            if check_hourly_cap_exceeded("radarr"):
-                radarr_logger.warning(f"🛑 Radarr API hourly limit reached - stopping upgrade processing after {processed_count} movies")
-                break
-        except Exception as e:
-            radarr_logger.error(f"Error checking hourly API cap: {e}")
-            # Continue processing if cap check fails - safer than stopping
-            
-        movie_id = movie.get("id")
-        movie_title = movie.get("title")
-        movie_year = movie.get("year")
-        
+        movie_id, movie_title, movie_year = movie.get("id"), movie.get("title"), movie.get("year")
         radarr_logger.info(f"Processing upgrade for movie: \"{movie_title}\" ({movie_year}) (Movie ID: {movie_id})")
-        
-        # Refresh functionality has been removed as it was identified as a performance bottleneck
-        
-        # Search for cutoff upgrade
-        radarr_logger.info(f"  - Searching for quality upgrade...")
-        search_result = radarr_api.movie_search(api_url, api_key, api_timeout, [movie_id])
-        
-        if search_result:
-            radarr_logger.info(f"  - Successfully triggered search for quality upgrade.")
-            add_processed_id("radarr", instance_name, str(movie_id))
-            increment_stat_only("radarr", "upgraded")
-            
-            # Tag the movie if enabled
-            if tag_processed_items:
-                from src.primary.settings_manager import get_custom_tag
-                custom_tag = get_custom_tag("radarr", "upgrade", "huntarr-upgraded")
-                try:
-                    radarr_api.tag_processed_movie(api_url, api_key, api_timeout, movie_id, custom_tag)
-                    radarr_logger.debug(f"Tagged movie {movie_id} with '{custom_tag}'")
-                except Exception as e:
-                    radarr_logger.warning(f"Failed to tag movie {movie_id} with '{custom_tag}': {e}")
-            
-            # Log to history so the upgrade appears in the history UI
-            media_name = f"{movie_title} ({movie_year})"
-            log_processed_media("radarr", media_name, movie_id, instance_name, "upgrade")
-            radarr_logger.debug(f"Logged quality upgrade to history for movie ID {movie_id}")
-            
-            processed_count += 1
-            processed_something = True
-        else:
-            radarr_logger.warning(f"  - Failed to trigger search for quality upgrade.")
+    
+    # Refresh functionality has been removed as it was identified as a performance bottleneck
+    
+    # Radarr's MoviesSearch command accepts several IDs, so search them all in one command
+    movie_ids = [movie["id"] for movie in movies_to_process]
+    radarr_logger.info(f"  - Searching for quality upgrades for {len(movie_ids)} movies...")
+    search_result = radarr_api.movie_search(api_url, api_key, api_timeout, movie_ids)
+    
+    if not search_result:
+        radarr_logger.warning("  - Failed to trigger search for quality upgrades.")
+        return False
+    
+    radarr_logger.info("  - Successfully triggered search for quality upgrades.")
+    
+    # arr_request charged the command itself; charge the rest of the batch per movie
+    if len(movie_ids) > 1:
+        increment_hourly_cap("radarr", len(movie_ids) - 1)
+    
+    # Tag the movies if enabled
+    if tag_processed_items:
+        _tag_upgraded_movies(api_url, api_key, api_timeout, movies_to_process, custom_tag)
+    
+    # Record every searched movie with one write per store
+    add_processed_ids("radarr", instance_name, movie_ids)
+    increment_stat_only("radarr", "upgraded", len(movie_ids))
+    
+    # Log to history so the upgrades appear in the history UI
+    log_processed_media_bulk(
+        "radarr",
+        [(movie.get("id"), f"{movie.get('title')} ({movie.get('year')})") for movie in movies_to_process],
+        instance_name,
+        "upgrade"
+    )
+    radarr_logger.debug("Logged %s quality upgrades to history", len(movie_ids))
+    processed_count = len(movie_ids)
             
     # Log final status
     radarr_logger.info(f"Completed processing {processed_count} movies for quality upgrades.")
     
-    return processed_something
\ No newline at end of file
+    return processed_count > 0
\ No newline at end of file
@@ -1067,8 +1067,8 @@ def unlink_plex_from_user(username: str = None) -> bool:
                 raise Exception("Plex-only user must set a local password before unlinking Plex account")
         
         # Use database to update user and remove Plex data
-        from src.primary.utils.database import HuntarrDatabase
-        db = HuntarrDatabase()
+        from src.primary.utils.database import get_database
+        db = get_database()
         
         # Update user to remove Plex data
         success = db.update_user_plex(user_data['username'], None, None)
@@ -816,9 +816,9 @@ def prowlarr_stats_loop():
                         break
                     continue
 
-                # Trigger cache update (safe even if cache is warm)
+                # Queue a cache refresh; skipped while the cache is fresh or a refresh is in flight
                 try:
-                    prow._update_stats_cache()
+                    prow.request_stats_refresh()
                 except Exception as e:
                     refresher_logger.error(f"Prowlarr stats refresh error: {e}", exc_info=True)
 
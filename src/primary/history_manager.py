@@ -79,6 +79,53 @@ def add_history_entry(app_type, entry_data):
             logger.error(f"Database error adding history entry for {app_type}: {e}")
             return None
 
+def add_history_entries(app_type, instance_name, items, operation_type="missing"):
+    """
+    Add several history entries for one app instance in a single database transaction
+    
+    Parameters:
+    - app_type: str - The app type (sonarr, radarr, etc)
+    - instance_name: str - Name of the instance that processed the media
+    - items: list - (media_id, media_name) pairs
+    - operation_type: str - Type of operation ("missing" or "upgrade")
+    
+    Returns:
+    - list - The created history entries, empty if failed
+    """
+    if app_type not in history_locks:
+        logger.error(f"Invalid app type: {app_type}")
+        return []
+    
+    if not items:
+        return []
+    
+    # Thread-safe database operation
+    with history_locks[app_type]:
+        try:
+            manager_db = get_manager_database()
+            entries = manager_db.add_hunt_history_entries(
+                app_type=app_type,
+                instance_name=instance_name,
+                items=[(str(media_id), media_name) for media_id, media_name in items],
+                operation_type=operation_type
+            )
+        except Exception as e:
+            logger.error(f"Database error adding history entries for {app_type}: {e}")
+            return []
+    
+    logger.info(f"Added {len(entries)} history entries for {app_type}-{instance_name}")
+    
+    # Send notifications about these history entries
+    try:
+        # Import here to avoid circular imports
+        from src.primary.notification_manager import send_history_notification
+        for entry in entries:
+            send_history_notification(entry)
+    except Exception as e:
+        logger.error(f"Failed to send notification for history entries: {e}")
+    
+    return entries
+
 def get_history(app_type, search_query=None, page=1, page_size=20):
     """
     Get history entries for an app
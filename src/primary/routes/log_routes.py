@@ -5,20 +5,34 @@ Replaces file-based log reading with database queries
 """
 
 from flask import Blueprint, jsonify, request, current_app
-from src.primary.utils.logger import get_logger
+from src.primary.utils.logger import get_logger, APP_LOG_FILES
 from src.primary.utils.database import get_logs_database
 from src.primary.utils.timezone_utils import get_user_timezone
 from datetime import datetime
+import time
 import pytz
 
 logger = get_logger(__name__)
 log_routes_bp = Blueprint('log_routes', __name__)
 
-def _convert_timestamp_to_user_timezone(timestamp_str: str) -> str:
-    """Convert UTC timestamp to user's current timezone setting"""
+# App types the log viewer can filter on, built once for O(1) request validation
+VALID_LOG_APP_TYPES = frozenset(APP_LOG_FILES) | {'all', 'system'}
+
+# Formatted log pages shared across clients polling with the same filters
+# Format: {(app_type, level, limit, offset, search, timezone): {'timestamp': timestamp, 'data': payload}}
+_log_page_cache = {}
+LOG_PAGE_CACHE_TTL = 2  # seconds
+
+def clear_log_page_cache():
+    """Drop cached log pages so the next poll reads the database"""
+    _log_page_cache.clear()
+
+def _convert_timestamp_to_user_timezone(timestamp_str: str, user_timezone=None) -> str:
+    """Convert UTC timestamp to user's current timezone setting (pass user_timezone to skip the lookup)"""
     try:
-        # Get current user timezone setting
-        user_timezone = get_user_timezone()
+        # Get current user timezone setting unless the caller already resolved it
+        if user_timezone is None:
+            user_timezone = get_user_timezone()
         
         # Parse the UTC timestamp (remove microseconds if present)
         if '.' in timestamp_str:
@@ -53,6 +67,14 @@ def _convert_timestamp_to_user_timezone(timestamp_str: str) -> str:
 @log_routes_bp.route('/api/logs/<app_type>')
 def get_logs(app_type):
     """Get logs for a specific app type from database"""
+    if app_type not in VALID_LOG_APP_TYPES:
+        return jsonify({
+            'success': False,
+            'error': f"Invalid app type: {app_type}",
+            'logs': [],
+            'total': 0
+        }), 400
+    
     try:
         logs_db = get_logs_database()
         
@@ -62,61 +84,55 @@ def get_logs(app_type):
         offset = int(request.args.get('offset', 0))
         search = request.args.get('search')
         
-        # Handle 'all' app type by getting logs from all apps
-        if app_type == 'all':
-            # Get logs from all app types
-            logs = logs_db.get_logs(
-                app_type=None,  # None means all app types
-                level=level,
-                limit=limit,
-                offset=offset,
-                search=search
-            )
-        else:
-            # Map 'system' to actual app type in database
-            db_app_type = 'system' if app_type == 'system' else app_type
-            
-            # Get logs from specific app type
-            logs = logs_db.get_logs(
-                app_type=db_app_type,
-                level=level,
-                limit=limit,
-                offset=offset,
-                search=search
-            )
+        # Resolve the user timezone once per request rather than once per line
+        user_timezone = get_user_timezone()
+        
+        # Several tabs or clients polling the same page share one database read
+        cache_key = (app_type, level, limit, offset, search, str(user_timezone))
+        cache_entry = _log_page_cache.get(cache_key)
+        if cache_entry and time.monotonic() - cache_entry['timestamp'] < LOG_PAGE_CACHE_TTL:
+            return jsonify(cache_entry['data'])
+        
+        # App tabs (including 'system') filter on their own app_type in SQL; None means all app types
+        db_app_type = None if app_type == 'all' else app_type
+        
+        logs = logs_db.get_logs(
+            app_type=db_app_type,
+            level=level,
+            limit=limit,
+            offset=offset,
+            search=search
+        )
         
         # Format logs for frontend (same format as file-based logs)
         formatted_logs = []
         for log in logs:
             # Convert timestamp to user timezone
-            display_timestamp = _convert_timestamp_to_user_timezone(log['timestamp'])
+            display_timestamp = _convert_timestamp_to_user_timezone(log['timestamp'], user_timezone)
             
             # Format as the frontend expects: timestamp|level|app_type|message
             formatted_log = f"{display_timestamp}|{log['level']}|{log['app_type']}|{log['message']}"
             formatted_logs.append(formatted_log)
         
         # Get total count for pagination
-        if app_type == 'all':
-            total_count = logs_db.get_log_count(
-                app_type=None,  # None means all app types
-                level=level,
-                search=search
-            )
-        else:
-            db_app_type = 'system' if app_type == 'system' else app_type
-            total_count = logs_db.get_log_count(
-                app_type=db_app_type,
-                level=level,
-                search=search
-            )
+        total_count = logs_db.get_log_count(
+            app_type=db_app_type,
+            level=level,
+            search=search
+        )
         
-        return jsonify({
+        payload = {
             'success': True,
             'logs': formatted_logs,
             'total': total_count,
             'offset': offset,
             'limit': limit
-        })
+        }
+        if len(_log_page_cache) >= 64:
+            # Distinct filter combinations only accumulate; start over rather than track ages
+            clear_log_page_cache()
+        _log_page_cache[cache_key] = {'timestamp': time.monotonic(), 'data': payload}
+        return jsonify(payload)
         
     except Exception as e:
         logger.error(f"Error getting logs for {app_type}: {e}")
@@ -137,6 +153,7 @@ def clear_logs(app_type):
         db_app_type = 'system' if app_type == 'system' else app_type
         
         deleted_count = logs_db.clear_logs(app_type=db_app_type)
+        clear_log_page_cache()
         
         return jsonify({
             'success': True,
@@ -166,6 +183,7 @@ def cleanup_logs():
             days_to_keep=days_to_keep,
             max_entries_per_app=max_entries_per_app
         )
+        clear_log_page_cache()
         
         return jsonify({
             'success': True,
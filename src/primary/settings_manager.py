@@ -23,11 +23,13 @@ from src.primary.utils.database import get_database
 DEFAULT_CONFIGS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), 'default_configs'))
 
 # Known app types
-KNOWN_APP_TYPES = ["sonarr", "radarr", "lidarr", "readarr", "whisparr", "eros", "swaparr", "prowlarr", "general"]
+KNOWN_APP_TYPES = ("sonarr", "radarr", "lidarr", "readarr", "whisparr", "eros", "swaparr", "prowlarr", "general")
+# Hashed copy for validation; KNOWN_APP_TYPES stays ordered because responses iterate it
+KNOWN_APP_TYPE_SET = frozenset(KNOWN_APP_TYPES)
 
 # Add a settings cache with timestamps to avoid excessive database reads
 settings_cache = {}  # Format: {app_name: {'timestamp': timestamp, 'data': settings_dict}}
-CACHE_TTL = 5  # Cache time-to-live in seconds
+CACHE_TTL = 60  # Cache time-to-live in seconds; save_settings and restores clear it explicitly
 
 def clear_cache(app_name=None):
     """Clear the settings cache for a specific app or all apps."""
@@ -105,19 +107,19 @@ def load_settings(app_type, use_cache=True):
     global settings_cache
     
     # Only log unexpected app types that are not 'general'
-    if app_type not in KNOWN_APP_TYPES and app_type != "general":
+    if app_type not in KNOWN_APP_TYPE_SET:
         settings_logger.warning(f"load_settings called with unexpected app_type: {app_type}")
     
     # Check if we have a valid cache entry
     if use_cache and app_type in settings_cache:
         cache_entry = settings_cache[app_type]
-        cache_age = time.time() - cache_entry.get('timestamp', 0)
+        cache_age = time.monotonic() - cache_entry.get('timestamp', 0)
         
         if cache_age < CACHE_TTL:
-            settings_logger.debug(f"Using cached settings for {app_type} (age: {cache_age:.1f}s)")
+            settings_logger.debug("Using cached settings for %s (age: %.1fs)", app_type, cache_age)
             return cache_entry['data']
         else:
-            settings_logger.debug(f"Cache expired for {app_type} (age: {cache_age:.1f}s)")
+            settings_logger.debug("Cache expired for %s (age: %.1fs)", app_type, cache_age)
     
     # No valid cache entry, load from database
     current_settings = {}
@@ -144,6 +146,19 @@ def load_settings(app_type, use_cache=True):
         settings_logger.error(f"Database error loading {app_type}: {e}")
         raise
     
+    return _finalize_loaded_settings(app_type, current_settings)
+
+def _finalize_loaded_settings(app_type, current_settings):
+    """
+    Fill in missing default keys, apply migrations and cache freshly loaded settings
+    
+    Args:
+        app_type: The app type the settings belong to
+        current_settings: Settings dict as read from the database
+        
+    Returns:
+        The completed settings dict
+    """
     # Load defaults to check for missing keys
     default_settings = load_default_app_settings(app_type)
     
@@ -168,15 +183,51 @@ def load_settings(app_type, use_cache=True):
     
     # Update cache
     settings_cache[app_type] = {
-        'timestamp': time.time(),
+        'timestamp': time.monotonic(),
         'data': current_settings
     }
         
     return current_settings
 
+def load_settings_many(app_names):
+    """
+    Load settings for several non-general app types, reading uncached ones in one query
+    
+    Args:
+        app_names: Iterable of app types to load
+        
+    Returns:
+        Dict mapping each app type to its settings dict
+    """
+    results = {}
+    missing = []
+    now = time.monotonic()
+    for app_name in app_names:
+        cache_entry = settings_cache.get(app_name)
+        if cache_entry and now - cache_entry.get('timestamp', 0) < CACHE_TTL:
+            results[app_name] = cache_entry['data']
+        else:
+            missing.append(app_name)
+    
+    if missing:
+        try:
+            stored = get_database().get_app_configs(missing)
+        except Exception as e:
+            settings_logger.error(f"Database error loading settings for {missing}: {e}")
+            raise
+        
+        for app_name in missing:
+            if app_name in stored:
+                results[app_name] = _finalize_loaded_settings(app_name, stored[app_name])
+            else:
+                # No row yet (or 'general'); the single-app path creates it from defaults
+                results[app_name] = load_settings(app_name)
+    
+    return results
+
 def save_settings(app_name: str, settings_data: Dict[str, Any]) -> bool:
     """Save settings for a specific app to database."""
-    if app_name not in KNOWN_APP_TYPES:
+    if app_name not in KNOWN_APP_TYPE_SET:
          settings_logger.error(f"Attempted to save settings for unknown app type: {app_name}")
          return False
     
@@ -261,6 +312,14 @@ def save_settings(app_name: str, settings_data: Dict[str, Any]) -> bool:
                 settings_logger.debug("Timezone cache cleared")
             except Exception as e:
                 settings_logger.warning(f"Could not clear timezone cache: {e}")
+        
+        # Prowlarr routes keep their own short-lived copy of the connection settings
+        if app_name == 'prowlarr':
+            try:
+                from src.primary.apps.prowlarr_routes import clear_settings_cache
+                clear_settings_cache()
+            except Exception as e:
+                settings_logger.warning(f"Could not clear Prowlarr settings cache: {e}")
     
     return success
 
@@ -184,6 +184,52 @@ def get_processed_ids(app_type: str, instance_name: str) -> Set[str]:
         stateful_logger.error(f"Error reading processed IDs for {instance_name} from database: {e}")
         return set()
 
+def _prepare_instance_state(app_type: str, instance_name: str) -> Optional[bool]:
+    """
+    Apply per-instance state management settings before reading or writing processed IDs.
+    
+    Looks up the instance's state management mode and hours, initializes its state
+    if needed and resets it once it has expired.
+    
+    Args:
+        app_type: The type of app (sonarr, radarr, etc.)
+        instance_name: The name of the instance
+        
+    Returns:
+        Optional[bool]: None if state management is disabled for the instance,
+        True if expired state was just reset, False otherwise
+    """
+    instance_hours = 168  # Default
+    
+    try:
+        from src.primary.settings_manager import load_settings
+        settings = load_settings(app_type)
+        
+        if settings and 'instances' in settings:
+            # Find the matching instance
+            for instance in settings['instances']:
+                if instance.get('name') == instance_name:
+                    instance_hours = instance.get('state_management_hours', 168)
+                    if instance.get('state_management_mode', 'custom') == 'disabled':
+                        return None
+                    break
+    except Exception as e:
+        stateful_logger.warning(f"Could not check state management mode for {app_type}/{instance_name}: {e}")
+        # Fall back to using state management if we can't determine the mode
+    
+    db = get_database()
+    
+    # Initialize per-instance state management if not already done
+    db.initialize_instance_state_management(app_type, instance_name, instance_hours)
+    
+    # Check if this instance's state has expired
+    if db.check_instance_expiration(app_type, instance_name):
+        stateful_logger.info(f"State management expired for {app_type}/{instance_name}, resetting...")
+        db.reset_instance_state_management(app_type, instance_name, instance_hours)
+        return True
+    
+    return False
+
 def add_processed_id(app_type: str, instance_name: str, media_id: str) -> bool:
     """
     Add a media ID to the processed list for a specific app instance.
@@ -201,40 +247,14 @@ def add_processed_id(app_type: str, instance_name: str, media_id: str) -> bool:
         return False
     
     try:
-        # First check if state management is enabled for this instance
-        instance_hours = 168  # Default
-        instance_mode = "custom"
-        
-        try:
-            from src.primary.settings_manager import load_settings
-            settings = load_settings(app_type)
-            
-            if settings and 'instances' in settings:
-                # Find the matching instance
-                for instance in settings['instances']:
-                    if instance.get('name') == instance_name:
-                        instance_mode = instance.get('state_management_mode', 'custom')
-                        instance_hours = instance.get('state_management_hours', 168)
-                        
-                        # If state management is disabled for this instance, don't add to processed list
-                        if instance_mode == 'disabled':
-                            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, not adding item {media_id} to processed list")
-                            return True  # Return True to indicate "success" (no error), but item wasn't actually added
-                        break
-        except Exception as e:
-            stateful_logger.warning(f"Could not check state management mode for {app_type}/{instance_name}: {e}")
-            # Fall back to adding anyway if we can't determine the mode
+        state_reset = _prepare_instance_state(app_type, instance_name)
+        if state_reset is None:
+            # State management is disabled for this instance, don't add to processed list
+            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, not adding item {media_id} to processed list")
+            return True  # Return True to indicate "success" (no error), but item wasn't actually added
         
         db = get_database()
         
-        # Initialize per-instance state management if not already done
-        db.initialize_instance_state_management(app_type, instance_name, instance_hours)
-        
-        # Check if this instance's state has expired
-        if db.check_instance_expiration(app_type, instance_name):
-            stateful_logger.info(f"State management expired for {app_type}/{instance_name}, resetting before adding new ID...")
-            db.reset_instance_state_management(app_type, instance_name, instance_hours)
-        
         # Check if already processed
         if db.is_processed(app_type, instance_name, media_id):
             stateful_logger.debug(f"[add_processed_id] ID {media_id} already in database for {app_type}/{instance_name}")
@@ -250,55 +270,71 @@ def add_processed_id(app_type: str, instance_name: str, media_id: str) -> bool:
         stateful_logger.error(f"Error adding media ID {media_id} to database: {e}")
         return False
 
-def is_processed(app_type: str, instance_name: str, media_id: str) -> bool:
+def add_processed_ids(app_type: str, instance_name: str, media_ids: List[str]) -> bool:
     """
-    Check if a media ID has already been processed.
+    Add several media IDs to the processed list for a specific app instance.
+    
+    Applies the same state management checks as add_processed_id once, then
+    writes all IDs in a single database transaction.
     
     Args:
         app_type: The type of app (sonarr, radarr, etc.)
         instance_name: The name of the instance
-        media_id: The ID of the media to check
+        media_ids: The IDs of the processed media
         
     Returns:
-        bool: True if already processed, False otherwise (or if state management is disabled)
+        bool: True if successful, False otherwise (or if state management is disabled)
     """
+    if app_type not in APP_TYPES:
+        stateful_logger.warning(f"Unknown app type: {app_type}")
+        return False
+    
+    if not media_ids:
+        return True
+    
     try:
-        # First check if state management is enabled for this instance
-        instance_hours = 168  # Default
-        instance_mode = "custom"
-        
-        try:
-            from src.primary.settings_manager import load_settings
-            settings = load_settings(app_type)
-            
-            if settings and 'instances' in settings:
-                # Find the matching instance
-                for instance in settings['instances']:
-                    if instance.get('name') == instance_name:
-                        instance_mode = instance.get('state_management_mode', 'custom')
-                        instance_hours = instance.get('state_management_hours', 168)
-                        
-                        # If state management is disabled for this instance, always return False (not processed)
-                        if instance_mode == 'disabled':
-                            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, treating item {media_id} as unprocessed")
-                            return False
-                        break
-        except Exception as e:
-            stateful_logger.warning(f"Could not check state management mode for {app_type}/{instance_name}: {e}")
-            # Fall back to checking anyway if we can't determine the mode
+        state_reset = _prepare_instance_state(app_type, instance_name)
+        if state_reset is None:
+            # State management is disabled for this instance, don't add to processed list
+            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, not adding {len(media_ids)} items to processed list")
+            return True  # Return True to indicate "success" (no error), but items weren't actually added
         
         db = get_database()
         
-        # Initialize per-instance state management if not already done
-        db.initialize_instance_state_management(app_type, instance_name, instance_hours)
+        # Already processed IDs are skipped by the insert itself
+        success = db.add_processed_ids(app_type, instance_name, [str(media_id) for media_id in media_ids])
+        if success:
+            stateful_logger.debug(f"[add_processed_ids] Added {len(media_ids)} IDs to database for {app_type}/{instance_name}")
         
-        # Check if this instance's state has expired
-        if db.check_instance_expiration(app_type, instance_name):
-            stateful_logger.info(f"State management expired for {app_type}/{instance_name}, resetting...")
-            db.reset_instance_state_management(app_type, instance_name, instance_hours)
+        return success
+    except Exception as e:
+        stateful_logger.error(f"Error adding {len(media_ids)} media IDs to database: {e}")
+        return False
+
+def is_processed(app_type: str, instance_name: str, media_id: str) -> bool:
+    """
+    Check if a media ID has already been processed.
+    
+    Args:
+        app_type: The type of app (sonarr, radarr, etc.)
+        instance_name: The name of the instance
+        media_id: The ID of the media to check
+        
+    Returns:
+        bool: True if already processed, False otherwise (or if state management is disabled)
+    """
+    try:
+        state_reset = _prepare_instance_state(app_type, instance_name)
+        if state_reset is None:
+            # If state management is disabled for this instance, always return False (not processed)
+            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, treating item {media_id} as unprocessed")
+            return False
+        if state_reset:
             # After reset, item is not processed
             return False
         
+        db = get_database()
+        
         # Converting media_id to string since some callers might pass an integer
         media_id_str = str(media_id)
         is_in_db = db.is_processed(app_type, instance_name, media_id_str)
@@ -314,6 +350,43 @@ def is_processed(app_type: str, instance_name: str, media_id: str) -> bool:
         stateful_logger.error(f"Error checking if processed for {app_type}/{instance_name}, ID:{media_id}: {e}")
         return False
 
+def is_processed_bulk(app_type: str, instance_name: str, media_ids: List[str]) -> Set[str]:
+    """
+    Check which of several media IDs have already been processed.
+    
+    Applies the same state management checks as is_processed, but reads the
+    processed IDs for the instance with a single database query.
+    
+    Args:
+        app_type: The type of app (sonarr, radarr, etc.)
+        instance_name: The name of the instance
+        media_ids: The IDs of the media to check
+        
+    Returns:
+        Set[str]: The subset of media_ids that are already processed (empty if state management is disabled)
+    """
+    try:
+        state_reset = _prepare_instance_state(app_type, instance_name)
+        if state_reset is None:
+            # If state management is disabled for this instance, nothing counts as processed
+            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, treating {len(media_ids)} items as unprocessed")
+            return set()
+        if state_reset:
+            # After reset, nothing is processed
+            return set()
+        
+        db = get_database()
+        
+        processed_ids = db.get_processed_ids(app_type, instance_name)
+        found = {str(media_id) for media_id in media_ids} & processed_ids
+        
+        stateful_logger.info(f"is_processed_bulk check: {app_type}/{instance_name}, Checked:{len(media_ids)}, Found:{len(found)}, Total IDs:{len(processed_ids)}")
+        
+        return found
+    except Exception as e:
+        stateful_logger.error(f"Error checking processed IDs for {app_type}/{instance_name}: {e}")
+        return set()
+
 def get_stateful_management_info() -> Dict[str, Any]:
     """Get information about the stateful management system."""
     lock_info = get_lock_info()
@@ -8,9 +8,10 @@ import logging
 import time
 import re
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import pytz
 
 
@@ -90,6 +91,57 @@ class CleanLogFormatter(logging.Formatter):
         return f"{timestamp_str}|{record.levelname}|{app_type}|{clean_message}"
 
 
+# Log records are buffered and written by a single background thread so a burst
+# of log lines costs one transaction instead of one connection and commit per line
+LOG_BATCH_SIZE = 64
+LOG_FLUSH_INTERVAL = 0.05  # seconds a burst may accumulate before it is written
+
+_pending_logs: List[Tuple] = []
+_pending_lock = threading.Lock()
+_logs_pending = threading.Event()
+_batch_full = threading.Event()
+_writer_thread: Optional[threading.Thread] = None
+
+
+def _queue_log_entry(entry: Tuple):
+    """Buffer a log row and make sure the writer thread is running"""
+    global _writer_thread
+    with _pending_lock:
+        _pending_logs.append(entry)
+        _logs_pending.set()
+        if len(_pending_logs) >= LOG_BATCH_SIZE:
+            _batch_full.set()
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_log_writer_loop, name="LogDatabaseWriter", daemon=True)
+            _writer_thread.start()
+
+
+def flush_pending_logs():
+    """Write all buffered log rows to the logs database"""
+    global _pending_logs
+    with _pending_lock:
+        batch = _pending_logs
+        _pending_logs = []
+        _logs_pending.clear()
+        _batch_full.clear()
+    if not batch:
+        return
+    try:
+        from src.primary.utils.database import get_logs_database
+        get_logs_database().insert_logs(batch)
+    except Exception as e:
+        # Don't use logger here to avoid infinite recursion
+        print(f"Error writing logs to database: {e}")
+
+
+def _log_writer_loop():
+    """Sleep until logs are queued, give the burst a moment to fill, then write it"""
+    while True:
+        _logs_pending.wait()
+        _batch_full.wait(LOG_FLUSH_INTERVAL)
+        flush_pending_logs()
+
+
 class DatabaseLogHandler(logging.Handler):
     """
     Custom log handler that writes clean log messages to the logs database.
@@ -98,19 +150,10 @@ class DatabaseLogHandler(logging.Handler):
     def __init__(self, app_type: str):
         super().__init__()
         self.formatter = CleanLogFormatter()
-        self._logs_db = None
         self.app_type = app_type
     
-    @property
-    def logs_db(self):
-        """Lazy load the logs database instance"""
-        if self._logs_db is None:
-            from src.primary.utils.database import get_logs_database
-            self._logs_db = get_logs_database()
-        return self._logs_db
-    
     def emit(self, record):
-        """Write the log record to the database"""
+        """Queue the log record for the next batched database write"""
         try:
             # Get only the clean message part, not the full formatted string
             # Check if formatter has _clean_message method (safety check)
@@ -137,16 +180,20 @@ class DatabaseLogHandler(logging.Handler):
             
             # Insert into database with UTC timestamp for timezone-agnostic storage
             utc_timestamp = datetime.fromtimestamp(record.created, tz=pytz.UTC)
-            self.logs_db.insert_log(
-                timestamp=utc_timestamp,
-                level=record.levelname,
-                app_type=app_type,
-                message=clean_message,
-                logger_name=getattr(record, 'name', None)
-            )
+            _queue_log_entry((
+                utc_timestamp,
+                record.levelname,
+                app_type,
+                clean_message,
+                getattr(record, 'name', None)
+            ))
         except Exception as e:
             # Don't use logger here to avoid infinite recursion
             print(f"Error writing log to database: {e}")
+    
+    def flush(self):
+        """Write buffered records now (called by logging.shutdown at exit)"""
+        flush_pending_logs()
 
 
 # Global database handlers registry
@@ -8,9 +8,10 @@ import os
 import json
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import logging
+import threading
 import time
 import shutil
 
@@ -635,6 +636,25 @@ class HuntarrDatabase:
                     return None
             return None
     
+    def get_app_configs(self, app_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get configurations for several app types in a single query (missing or unparsable rows are omitted)"""
+        if not app_types:
+            return {}
+        placeholders = ','.join('?' * len(app_types))
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f'SELECT app_type, config_data FROM app_configs WHERE app_type IN ({placeholders})',
+                tuple(app_types)
+            )
+            
+            configs = {}
+            for app_type, config_data in cursor.fetchall():
+                try:
+                    configs[app_type] = json.loads(config_data)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Failed to parse JSON for {app_type}: {e}")
+            return configs
+    
     def save_app_config(self, app_type: str, config_data: Dict[str, Any]):
         """Save app configuration to database"""
         config_json = json.dumps(config_data, indent=2)
@@ -858,6 +878,22 @@ class HuntarrDatabase:
             logger.error(f"Error adding processed ID {media_id} for {app_type}/{instance_name}: {e}")
             return False
     
+    def add_processed_ids(self, app_type: str, instance_name: str, media_ids: List[str]) -> bool:
+        """Add several processed media IDs for a specific app instance in one transaction"""
+        try:
+            with self.get_connection() as conn:
+                conn.executemany('''
+                    INSERT OR IGNORE INTO stateful_processed_ids 
+                    (app_type, instance_name, media_id)
+                    VALUES (?, ?, ?)
+                ''', [(app_type, instance_name, str(media_id)) for media_id in media_ids])
+                conn.commit()
+                logger.debug(f"Added {len(media_ids)} processed IDs for {app_type}/{instance_name}")
+                return True
+        except Exception as e:
+            logger.error(f"Error adding {len(media_ids)} processed IDs for {app_type}/{instance_name}: {e}")
+            return False
+    
     def is_processed(self, app_type: str, instance_name: str, media_id: str) -> bool:
         """Check if a media ID has been processed for a specific app instance"""
         with self.get_connection() as conn:
@@ -2157,6 +2193,37 @@ class HuntarrDatabase:
             logger.info(f"Added hunt history entry for {app_type}-{instance_name}: {processed_info}")
             return entry
     
+    def add_hunt_history_entries(self, app_type: str, instance_name: str, items: List[Tuple[str, str]],
+                                 operation_type: str = "missing") -> List[Dict[str, Any]]:
+        """Add several hunt history entries, given as (media_id, processed_info) pairs, in one transaction"""
+        date_time = int(time.time())
+        date_time_readable = datetime.fromtimestamp(date_time).strftime('%Y-%m-%d %H:%M:%S')
+        
+        entries = []
+        with self.get_connection() as conn:
+            for media_id, processed_info in items:
+                cursor = conn.execute('''
+                    INSERT INTO hunt_history 
+                    (app_type, instance_name, media_id, processed_info, operation_type, discovered, date_time, date_time_readable)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (app_type, instance_name, media_id, processed_info, operation_type, False, date_time, date_time_readable))
+                
+                entries.append({
+                    "id": cursor.lastrowid,
+                    "app_type": app_type,
+                    "instance_name": instance_name,
+                    "media_id": media_id,
+                    "processed_info": processed_info,
+                    "operation_type": operation_type,
+                    "discovered": False,
+                    "date_time": date_time,
+                    "date_time_readable": date_time_readable
+                })
+            conn.commit()
+        
+        logger.info(f"Added {len(entries)} hunt history entries for {app_type}-{instance_name}")
+        return entries
+    
     def get_hunt_history(self, app_type: str = None, search_query: str = None, 
                    page: int = 1, page_size: int = 20) -> Dict[str, Any]:
         """Get hunt history entries with pagination and filtering"""
@@ -2401,6 +2468,10 @@ class LogsDatabase:
     def __init__(self):
         self.db_path = self._get_logs_database_path()
         self.ensure_logs_database_exists()
+        # Persistent connection used by batched log writes (see insert_logs)
+        self._writer_conn = None
+        self._writer_inode = None
+        self._writer_lock = threading.Lock()
     
     def _get_logs_database_path(self) -> Path:
         """Get logs database path - same directory as main database but separate file"""
@@ -2459,25 +2530,30 @@ class LogsDatabase:
             logger.error(f"Error configuring logs database connection: {e}")
             pass
     
-    def get_logs_connection(self):
+    def get_logs_connection(self, check_same_thread: bool = True):
         """Get a configured SQLite connection for logs database"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
             self._configure_logs_connection(conn)
             # Test connection
             conn.execute("SELECT name FROM sqlite_master WHERE type='table' LIMIT 1").fetchone()
             return conn
         except (sqlite3.DatabaseError, sqlite3.OperationalError) as e:
-            if "file is not a database" in str(e) or "database disk image is malformed" in str(e):
+            if self._is_logs_corruption_error(e):
                 logger.error(f"Logs database corruption detected: {e}")
                 self._handle_logs_database_corruption()
                 # Try connecting again after recovery
-                conn = sqlite3.connect(self.db_path)
+                conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
                 self._configure_logs_connection(conn)
                 return conn
             else:
                 raise
     
+    @staticmethod
+    def _is_logs_corruption_error(error: Exception) -> bool:
+        """Check whether a SQLite error means the logs database file is corrupted"""
+        return "file is not a database" in str(error) or "database disk image is malformed" in str(error)
+    
     def _handle_logs_database_corruption(self):
         """Handle logs database corruption"""
         import time
@@ -2549,7 +2625,71 @@ class LogsDatabase:
         except Exception as e:
             # Don't let log insertion failures crash the app
             print(f"Error inserting log: {e}")
-    
+
+    def _get_writer_connection(self):
+        """Return the persistent write connection, reopening it if logs.db was replaced on disk"""
+        try:
+            current_inode = os.stat(self.db_path).st_ino
+        except OSError:
+            current_inode = None
+        if self._writer_conn is not None and current_inode != self._writer_inode:
+            self._close_writer_connection()
+        if self._writer_conn is None:
+            if current_inode is None:
+                # logs.db was deleted; recreate it with its tables rather than writing into an empty file
+                self.ensure_logs_database_exists()
+            # Shared by the writer thread and shutdown flushes, serialized by _writer_lock
+            self._writer_conn = self.get_logs_connection(check_same_thread=False)
+            self._writer_inode = os.stat(self.db_path).st_ino
+        return self._writer_conn
+    
+    def _close_writer_connection(self):
+        """Close the persistent write connection; the next batch opens a fresh one"""
+        if self._writer_conn is not None:
+            try:
+                self._writer_conn.close()
+            except Exception:
+                pass
+        self._writer_conn = None
+        self._writer_inode = None
+    
+    def insert_logs(self, entries: List[Tuple[datetime, str, str, str, Optional[str]]]):
+        """Insert a batch of (timestamp, level, app_type, message, logger_name) entries in one transaction"""
+        if not entries:
+            return
+        with self._writer_lock:
+            # A failed batch gets one retry on a fresh connection before it is dropped
+            for attempt in range(2):
+                try:
+                    self._write_log_batch(entries)
+                    return
+                except Exception as e:
+                    # Don't let log insertion failures crash the app
+                    self._close_writer_connection()
+                    if attempt:
+                        print(f"Error inserting logs, dropping {len(entries)} entries: {e}")
+                        return
+                    print(f"Error inserting logs, retrying on a fresh connection: {e}")
+                    if isinstance(e, sqlite3.DatabaseError):
+                        corrupted = self._is_logs_corruption_error(e)
+                        # A missing table means logs.db was recreated (e.g. after corruption recovery) without its schema
+                        if corrupted or "no such table" in str(e):
+                            try:
+                                if corrupted:
+                                    self._handle_logs_database_corruption()
+                                self.ensure_logs_database_exists()
+                            except Exception as recovery_error:
+                                print(f"Error recovering logs database: {recovery_error}")
+    
+    def _write_log_batch(self, entries: List[Tuple[datetime, str, str, str, Optional[str]]]):
+        """Write a batch on the persistent connection in one transaction (caller holds _writer_lock)"""
+        conn = self._get_writer_connection()
+        with conn:
+            conn.executemany('''
+                INSERT INTO logs (timestamp, level, app_type, message, logger_name)
+                VALUES (?, ?, ?, ?, ?)
+            ''', entries)
+
     def get_logs(self, app_type: str = None, level: str = None, limit: int = 100, offset: int = 0, search: str = None) -> List[Dict[str, Any]]:
         """Get logs with filtering and pagination"""
         try:
@@ -2693,15 +2833,18 @@ class LogsDatabase:
             logger.error(f"Error clearing logs: {e}")
             return 0
 
-# Global database instances
+# Global database instances; the lock keeps concurrent first callers from each running schema setup
 _database_instance = None
 _logs_database_instance = None
+_instance_lock = threading.Lock()
 
 def get_database() -> HuntarrDatabase:
     """Get the global database instance"""
     global _database_instance
     if _database_instance is None:
-        _database_instance = HuntarrDatabase()
+        with _instance_lock:
+            if _database_instance is None:
+                _database_instance = HuntarrDatabase()
     return _database_instance
 
 # Logs Database Functions (consolidated from logs_database.py)
@@ -2709,7 +2852,9 @@ def get_logs_database() -> LogsDatabase:
     """Get the logs database instance for logs operations"""
     global _logs_database_instance
     if _logs_database_instance is None:
-        _logs_database_instance = LogsDatabase()
+        with _instance_lock:
+            if _logs_database_instance is None:
+                _logs_database_instance = LogsDatabase()
     return _logs_database_instance
 
 def schedule_log_cleanup():
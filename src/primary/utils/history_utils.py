@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import time
-from src.primary.history_manager import add_history_entry
+from src.primary.history_manager import add_history_entry, add_history_entries
 from src.primary.utils.logger import get_logger
 
 logger = get_logger("history")
@@ -62,3 +62,49 @@ def log_processed_media(app_type, media_name, media_id, instance_name, operation
     except Exception as e:
         logger.error(f"Error logging history entry: {str(e)}")
         return False
+
+def log_processed_media_bulk(app_type, items, instance_name, operation_type="missing"):
+    """
+    Log several media items processed in one pass by an app instance
+    
+    Parameters:
+    - app_type: str - The app type (sonarr, radarr, etc)
+    - items: list - (media_id, media_name) pairs of the processed media
+    - instance_name: str - Name of the instance that processed them
+    - operation_type: str - Type of operation ("missing" or "upgrade")
+    
+    Returns:
+    - bool - Success or failure
+    """
+    try:
+        current_time = time.time()
+        
+        # Clean up old entries from cache
+        expired_keys = [k for k, v in _recent_log_entries.items() if current_time - v > _DUPLICATE_WINDOW_SECONDS]
+        for key in expired_keys:
+            del _recent_log_entries[key]
+        
+        # Drop entries that were logged recently, same as log_processed_media
+        pending = []
+        for media_id, media_name in items:
+            entry_key = f"{app_type}|{instance_name}|{media_name}|{operation_type}"
+            if entry_key in _recent_log_entries:
+                logger.debug(f"Skipping duplicate history entry for {app_type} - {instance_name}: {media_name}")
+                continue
+            pending.append((entry_key, media_id, media_name))
+        
+        if not pending:
+            return True
+        
+        entries = add_history_entries(app_type, instance_name, [(media_id, media_name) for _, media_id, media_name in pending], operation_type)
+        if entries:
+            for entry_key, _, _ in pending:
+                _recent_log_entries[entry_key] = current_time
+            logger.info(f"Logged {len(entries)} history entries for {app_type} - {instance_name} ({operation_type})")
+            return True
+        else:
+            logger.error(f"Failed to log {len(pending)} history entries for {app_type} - {instance_name}")
+            return False
+    except Exception as e:
+        logger.error(f"Error logging history entries: {str(e)}")
+        return False
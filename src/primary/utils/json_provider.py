@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+orjson-backed JSON provider for the Flask app.
+Serializes jsonify() responses with orjson while keeping Flask's handling of
+dates, decimals, UUIDs and dataclasses through the default provider's hook.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that uses orjson for the compact, no-options path"""
+
+    def _option(self) -> int:
+        # Non-string keys are stringified like the stdlib encoder does; datetimes go
+        # through Flask's default() so they keep the HTTP date format clients expect
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string; explicit json.dumps options use the stdlib encoder"""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._option()).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON str or bytes document"""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response, writing orjson's bytes straight into the body"""
+        if self.compact is False or (self.compact is None and self._app.debug):
+            # Pretty-printed output is only used in debug mode; keep Flask's formatting there
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._option() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
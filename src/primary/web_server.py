@@ -14,6 +14,8 @@ from src.primary.stateful_manager import update_lock_expiration # Import statefu
 
 # import socket # No longer used
 import json
+import orjson
+import re
 # import signal # No longer used for reload
 import sys
 import qrcode
@@ -21,12 +23,20 @@ import pyotp
 import logging
 import threading
 import importlib # Added import
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 import requests
 from flask import Flask, render_template, request, jsonify, Response, send_from_directory, redirect, url_for, session, stream_with_context, Blueprint, current_app, g, make_response # Added stream_with_context and Blueprint
 # from src.primary.config import API_URL # No longer needed directly
 # Use only settings_manager
 from src.primary import settings_manager
-from src.primary.utils.logger import setup_main_logger, get_logger, LOG_DIR, update_logging_levels # Import get_logger, LOG_DIR, and update_logging_levels
+from src.primary.utils.logger import setup_main_logger, get_logger, LOG_DIR, update_logging_levels, refresh_timezone_formatters # Import get_logger, LOG_DIR, and update_logging_levels
+from src.primary.utils.database import get_database
+from src.primary.stats_manager import load_hourly_caps, reset_stats
+from src.primary.cycle_tracker import get_cycle_status
+from src.primary.notification_manager import send_notification, get_notification_config, apprise_import_error
+from src.primary.utils.json_provider import OrjsonProvider
 # Clean logging is now database-only
 from src.primary.auth import (
     authenticate_request, user_exists, create_user, verify_user, create_session,
@@ -59,9 +69,41 @@ from src.primary.routes.log_routes import log_routes_bp
 # Import background module to trigger manual cycle resets
 from src.primary import background
 
-# Disable Flask default logging
+class _PollingRequestFilter(logging.Filter):
+    """Drop Werkzeug access-log lines for endpoints the UI polls continuously"""
+    POLLING_PATHS = ('/api/logs', '/api/hunt-manager', '/logs')
+
+    def filter(self, record):
+        # Access-log records carry the request line ("GET /path HTTP/1.1") as their first arg
+        request_line = record.args[0] if isinstance(record.args, tuple) and record.args else ''
+        if not isinstance(request_line, str):
+            return True
+        parts = request_line.split(' ', 2)
+        return not (len(parts) > 1 and parts[1].startswith(self.POLLING_PATHS))
+
+# Shared loggers for all route handlers in this module
+web_logger = get_logger("web_server")
+system_logger = get_logger("system")
+
+# Werkzeug request logging; set HUNTARR_DEBUG_WERKZEUG=true to see all Flask/Werkzeug logs
 log = logging.getLogger('werkzeug')
-log.setLevel(logging.DEBUG)  # Change to DEBUG to see all Flask/Werkzeug logs
+log.setLevel(logging.DEBUG if os.environ.get('HUNTARR_DEBUG_WERKZEUG', 'false').lower() == 'true' else logging.INFO)
+log.addFilter(_PollingRequestFilter())
+
+def _find_dir(candidates, required_child=None):
+    """
+    Return the first candidate directory that exists (and contains required_child, if given).
+    Each candidate costs a single scandir call; missing or non-directory paths are skipped.
+    """
+    for candidate in candidates:
+        candidate_path = os.path.abspath(candidate)
+        try:
+            with os.scandir(candidate_path) as entries:
+                if required_child is None or any(entry.name == required_child for entry in entries):
+                    return candidate_path
+        except OSError:
+            continue
+    return None
 
 # Configure template and static paths with proper PyInstaller support
 if getattr(sys, 'frozen', False):
@@ -75,19 +117,8 @@ if getattr(sys, 'frozen', False):
         os.path.join(os.path.dirname(base_path), 'Resources', 'frontend', 'templates') # Mac app bundle with different path
     ]
     
-    # Find the first existing templates directory
-    template_dir = None
-    for candidate in template_candidates:
-        candidate_path = os.path.abspath(candidate)
-        print(f"Checking template candidate: {candidate_path}")
-        if os.path.exists(candidate_path) and os.path.isdir(candidate_path):
-            template_dir = candidate_path
-            print(f"Found valid template directory: {template_dir}")
-            if os.path.exists(os.path.join(template_dir, 'setup.html')):
-                print(f"Found setup.html template in {template_dir}")
-                break
-            else:
-                print(f"Warning: setup.html not found in {template_dir}")
+    # Prefer a templates directory that actually contains setup.html
+    template_dir = _find_dir(template_candidates, 'setup.html') or _find_dir(template_candidates)
     
     # Similar approach for static files
     static_candidates = [
@@ -97,38 +128,25 @@ if getattr(sys, 'frozen', False):
         os.path.join(os.path.dirname(base_path), 'Resources', 'frontend', 'static')
     ]
     
-    # Find the first existing static directory
-    static_dir = None
-    for candidate in static_candidates:
-        candidate_path = os.path.abspath(candidate)
-        if os.path.exists(candidate_path) and os.path.isdir(candidate_path):
-            static_dir = candidate_path
-            print(f"Found valid static directory: {static_dir}")
-            break
+    static_dir = _find_dir(static_candidates)
     
     # If no valid directories found, use defaults
     if not template_dir:
         template_dir = os.path.join(base_path, 'templates')
-        print(f"Warning: Using default template dir: {template_dir}")
+        print(f"Warning: No template directory found in {template_candidates}, using default: {template_dir}")
     
     if not static_dir:
         static_dir = os.path.join(base_path, 'static')
-        print(f"Warning: Using default static dir: {static_dir}")
+        print(f"Warning: No static directory found in {static_candidates}, using default: {static_dir}")
         
     print(f"PyInstaller mode - Using template dir: {template_dir}")
     print(f"PyInstaller mode - Using static dir: {static_dir}")
-    print(f"Template dir exists: {os.path.exists(template_dir)}")
-    if os.path.exists(template_dir):
-        print(f"Template dir contents: {os.listdir(template_dir)}")
 else:
     # Normal Python execution
     template_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'frontend', 'templates'))
     static_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'frontend', 'static'))
     print(f"Normal mode - Using templates dir: {template_dir}")
     print(f"Normal mode - Using static dir: {static_dir}")
-    print(f"Template dir exists: {os.path.exists(template_dir)}")
-    if os.path.exists(template_dir):
-        print(f"Template dir contents: {os.listdir(template_dir)}")
 
 # Get base_url from settings (used for reverse proxy subpath configurations)
 def get_base_url():
@@ -152,12 +170,21 @@ def get_base_url():
         print(f"Error getting base_url from settings: {e}")
         return ''
 
-# Define base_url at module level
+# Define base_url at module level; templates read this cached value. It is set by
+# configure_base_url() at startup and refreshed by refresh_cached_base_url() when settings are saved
 base_url = ''
 
 # Check for Windows platform and integrate Windows-specific helpers
 import platform
-if platform.system() == "Windows":
+# Host details never change while the process runs; read them once
+_SYSTEM_INFO = {
+    "platform": platform.system(),
+    "platform_release": platform.release(),
+    "python_version": platform.python_version()
+}
+_IS_WINDOWS = _SYSTEM_INFO["platform"] == "Windows"
+
+if _IS_WINDOWS:
     # Import Windows integration module for startup support
     try:
         from src.primary.utils.windows_integration import prepare_windows_environment
@@ -173,7 +200,7 @@ app = Flask(__name__,
              static_url_path='/static')
 
 # Apply Windows-specific patches to Flask app if on Windows
-if platform.system() == "Windows":
+if _IS_WINDOWS:
     try:
         from src.primary.utils.windows_integration import integrate_windows_helpers
         app = integrate_windows_helpers(app)
@@ -181,6 +208,17 @@ if platform.system() == "Windows":
         print(f"Error applying Windows patches: {e}")
 
 app.config['FLASK_ADMIN_SWATCH'] = 'cerulean'
+
+# Serialize jsonify() responses with orjson; keep dict order and never pretty-print
+app.json = OrjsonProvider(app)
+app.json.sort_keys = False
+app.json.compact = True
+
+# Let a fronting web server (Apache mod_xsendfile, lighttpd) send static files itself.
+# Opt-in only: without a proxy that understands X-Sendfile, browsers would get empty responses.
+if os.environ.get('HUNTARR_X_SENDFILE', 'false').lower() == 'true':
+    app.use_x_sendfile = True
+    print("X-Sendfile enabled for static files")
 print(f"Flask app created with template_folder: {app.template_folder}")
 print(f"Flask app created with static_folder: {app.static_folder}")
 
@@ -205,6 +243,14 @@ def configure_base_url():
 # Initial base URL configuration (will be empty if database not initialized yet)
 configure_base_url()
 
+def refresh_cached_base_url():
+    """Re-read the base URL used by templates; APPLICATION_ROOT only changes on restart"""
+    global base_url
+    try:
+        base_url = get_base_url()
+    except Exception as e:
+        print(f"Error refreshing base URL setting: {e}")
+
 def reconfigure_base_url():
     """Reconfigure the Flask app base URL after environment variables are processed"""
     print("Reconfiguring base URL after environment variable processing...")
@@ -259,28 +305,49 @@ def debug_template_rendering():
             raise
     
     app.jinja_env.loader.get_source = get_source_wrapper
-    
-debug_template_rendering()
+
+def configure_template_cache():
+    """Persist compiled templates next to the database so restarts skip recompilation"""
+    try:
+        from jinja2 import FileSystemBytecodeCache
+        cache_dir = get_database().db_path.parent / "jinja_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=str(cache_dir))
+    except Exception as e:
+        print(f"Template bytecode cache disabled: {e}")
+
+# Template tracing and auto-reload re-stat templates on every render, so only enable them in debug mode
+if os.environ.get('DEBUG', 'false').lower() == 'true':
+    debug_template_rendering()
+else:
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+    configure_template_cache()
 
 app.secret_key = os.environ.get('SECRET_KEY', 'dev_key_for_sessions')
 
-# Register blueprints
-app.register_blueprint(common_bp)
-app.register_blueprint(plex_auth_bp)
-app.register_blueprint(sonarr_bp, url_prefix='/api/sonarr')
-app.register_blueprint(radarr_bp, url_prefix='/api/radarr')
-app.register_blueprint(lidarr_bp, url_prefix='/api/lidarr')
-app.register_blueprint(readarr_bp, url_prefix='/api/readarr')
-app.register_blueprint(whisparr_bp, url_prefix='/api/whisparr')
-app.register_blueprint(eros_bp, url_prefix='/api/eros')
-app.register_blueprint(swaparr_bp, url_prefix='/api/swaparr')
-app.register_blueprint(prowlarr_bp, url_prefix='/api/prowlarr')
-app.register_blueprint(requestarr_bp)
-app.register_blueprint(stateful_api, url_prefix='/api/stateful')
-app.register_blueprint(history_blueprint, url_prefix='/api/hunt-manager')
-app.register_blueprint(scheduler_api)
-app.register_blueprint(log_routes_bp)
-app.register_blueprint(backup_bp)
+# Register blueprints (blueprint, url_prefix); None keeps the prefix defined on the blueprint
+BLUEPRINTS = (
+    (common_bp, None),
+    (plex_auth_bp, None),
+    (sonarr_bp, '/api/sonarr'),
+    (radarr_bp, '/api/radarr'),
+    (lidarr_bp, '/api/lidarr'),
+    (readarr_bp, '/api/readarr'),
+    (whisparr_bp, '/api/whisparr'),
+    (eros_bp, '/api/eros'),
+    (swaparr_bp, '/api/swaparr'),
+    (prowlarr_bp, '/api/prowlarr'),
+    (requestarr_bp, None),
+    (stateful_api, '/api/stateful'),
+    (history_blueprint, '/api/hunt-manager'),
+    (scheduler_api, None),
+    (log_routes_bp, None),
+    (backup_bp, None),
+)
+
+for blueprint, url_prefix in BLUEPRINTS:
+    app.register_blueprint(blueprint, url_prefix=url_prefix)
 
 # Register the authentication check to run before requests
 app.before_request(authenticate_request)
@@ -315,247 +382,6 @@ def user():
 # Removed /settings and /logs routes if handled by index.html and JS routing
 # Keep /logs if it's the actual SSE endpoint
 
-# Old file-based logs route removed - using database-based logs now
-    """
-    Event stream for logs.
-    Filter logs by app type using the 'app' query parameter.
-    Supports 'all', 'system', 'sonarr', 'radarr', 'lidarr', 'readarr'.
-    Example: /logs?app=sonarr
-    """
-    app_type = request.args.get('app', 'all')  # Default to 'all' if no app specified
-    web_logger = get_logger("web_server")
-
-    valid_app_types = list(KNOWN_LOG_FILES.keys()) + ['all']
-    if app_type not in valid_app_types:
-        web_logger.warning(f"Invalid app type '{app_type}' requested for logs. Defaulting to 'all'.")
-        app_type = 'all'
-
-    # Import needed modules
-    import time
-    from pathlib import Path
-    import threading
-    import datetime # Added datetime import
-    import time  # Add time module import
-
-    # Use a client identifier to track connections
-    # Use request.remote_addr directly for client_id
-    client_id = request.remote_addr 
-    current_time_str = datetime.datetime.now().strftime("%H:%M:%S") # Renamed variable
-
-    web_logger.debug(f"Starting log stream for app type: {app_type} (client: {client_id}, time: {current_time_str})")
-
-    # Track active connections to limit resource usage
-    if not hasattr(app, 'active_log_streams'):
-        app.active_log_streams = {}
-        app.log_stream_lock = threading.Lock()
-
-    # Clean up stale connections (older than 60 seconds without activity)
-    with app.log_stream_lock:
-        current_time = time.time()
-        stale_clients = [c for c, t in app.active_log_streams.items()
-                         if current_time - t > 60]
-        for client in stale_clients:
-            # Check if client exists before popping, avoid KeyError
-            if client in app.active_log_streams:
-                app.active_log_streams.pop(client)
-                web_logger.debug(f"Removed stale log stream connection for client: {client}")
-
-        # If too many connections, return an error for new ones
-        # Increased limit slightly and check before adding the new client
-        MAX_LOG_CONNECTIONS = 10 # Define as constant
-        if len(app.active_log_streams) >= MAX_LOG_CONNECTIONS:
-            web_logger.warning(f"Too many log stream connections ({len(app.active_log_streams)}). Rejecting new connection from {client_id}")
-            # Send SSE formatted error message
-            return Response("event: error\ndata: Too many active connections. Please try again later.\n\n",
-                           mimetype='text/event-stream', status=429) # Use 429 status code
-
-        # Add/Update this client's timestamp *after* checking the limit
-        app.active_log_streams[client_id] = current_time
-        web_logger.debug(f"Active log streams: {len(app.active_log_streams)} clients. Added/Updated: {client_id}")
-
-
-    def generate():
-        """Generate log events for the SSE stream."""
-        client_ip = request.remote_addr
-        web_logger.debug(f"Log stream generator started for {app_type} (Client: {client_ip})")
-        try:
-            # Initialize last activity time
-            last_activity = time.time()
-
-            # Determine which log files to follow
-            log_files_to_follow = []
-            if app_type == 'all':
-                log_files_to_follow = list(KNOWN_LOG_FILES.items())
-            elif app_type == 'system':
-                # For system, only follow main log
-                system_log = KNOWN_LOG_FILES.get('system')
-                if system_log:
-                    log_files_to_follow = [('system', system_log)]
-                    web_logger.debug(f"Following system log: {system_log}")
-            else:
-                # For specific app, follow that app's log
-                app_log = KNOWN_LOG_FILES.get(app_type)
-                if app_log:
-                    log_files_to_follow = [(app_type, app_log)]
-                    web_logger.debug(f"Following {app_type} log: {app_log}")
-                
-                # Also include system log for related messages
-                system_log = KNOWN_LOG_FILES.get('system')
-                if system_log:
-                    log_files_to_follow.append(('system', system_log))
-                    web_logger.debug(f"Also following system log for {app_type} messages")
-
-            if not log_files_to_follow:
-                web_logger.warning(f"No log files found for app type: {app_type}")
-                yield f"data: No logs available for {app_type}\n\n"
-                return
-
-            # Send confirmation
-            yield f"data: Starting log stream for {app_type}...\n\n"
-            web_logger.debug(f"Sent confirmation for {app_type} (Client: {client_ip})")
-
-            # Track file positions
-            positions = {}
-            last_check = {}
-            keep_alive_counter = 0
-
-            # Convert to Path objects
-            log_files_to_follow = [(name, Path(path) if isinstance(path, str) else path)
-                               for name, path in log_files_to_follow if path]
-
-            # Main streaming loop
-            while True:
-                had_content = False
-                current_time = time.time()
-
-                # Update client activity
-                if current_time - last_activity > 10:
-                    with app.log_stream_lock:
-                        if client_id in app.active_log_streams:
-                            app.active_log_streams[client_id] = current_time
-                        else:
-                            web_logger.debug(f"Client {client_id} gone. Stopping generator.")
-                            break
-                    last_activity = current_time
-
-                keep_alive_counter += 1
-
-                # Check each file
-                for name, path in log_files_to_follow:
-                    try:
-                        # Limit check frequency
-                        now = datetime.datetime.now()
-                        if name in last_check and (now - last_check[name]).total_seconds() < 0.2:
-                            continue
-                        
-                        last_check[name] = now
-
-                        # Check file exists
-                        if not path.exists():
-                            if positions.get(name) != -1:
-                                web_logger.warning(f"Log file {path} not found. Skipping.")
-                                positions[name] = -1
-                            continue
-                        elif positions.get(name) == -1:
-                            web_logger.info(f"Log file {path} found again. Resuming.")
-                            positions.pop(name, None)
-
-                        # Get size
-                        try:
-                            current_size = path.stat().st_size
-                        except FileNotFoundError:
-                            web_logger.warning(f"Log file {path} disappeared. Skipping.")
-                            positions[name] = -1
-                            continue
-
-                        # Init position or handle truncation
-                        if name not in positions or current_size < positions.get(name, 0):
-                            start_pos = max(0, current_size - 5120)
-                            web_logger.debug(f"Init position for {name}: {start_pos}")
-                            positions[name] = start_pos
-
-                        # Read content
-                        try:
-                            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                                f.seek(positions[name])
-                                new_lines = []
-                                lines_read = 0
-                                max_lines = 100
-
-                                while lines_read < max_lines:
-                                    line = f.readline()
-                                    if not line:
-                                        break
-                                    
-                                    # Only filter when reading system log for specific app tab
-                                    if app_type != 'all' and app_type != 'system' and name == 'system':
-                                        # MODIFIED: Don't include system logs in app tabs at all
-                                        include_line = False
-                                    else:
-                                        include_line = True
-                                    
-                                    if include_line:
-                                        new_lines.append(line)
-                                    
-                                    lines_read += 1
-
-                                # Process collected lines
-                                if new_lines:
-                                    had_content = True
-                                    positions[name] = f.tell()
-                                    for line in new_lines:
-                                        stripped = line.strip()
-                                        if stripped:
-                                            prefix = f"[{name.lower()}] " if app_type == 'all' else ""
-                                            yield f"data: {prefix}{stripped}\n\n"
-                        
-                        except FileNotFoundError:
-                            web_logger.warning(f"Log file {path} disappeared during read.")
-                            positions[name] = -1
-                        except Exception as e:
-                            web_logger.error(f"Error reading {path}: {e}")
-                            yield f"data: ERROR: Problem reading log: {str(e)}\n\n"
-                    
-                    except Exception as e:
-                        web_logger.error(f"Error processing {name}: {e}")
-                        yield f"data: ERROR: Unexpected issue with log.\n\n"
-
-                # Keep-alive or sleep
-                if not had_content:
-                    if keep_alive_counter >= 75:
-                        yield f": keepalive {time.time()}\n\n"
-                        keep_alive_counter = 0
-                    time.sleep(0.2)
-                else:
-                    keep_alive_counter = 0
-                    time.sleep(0.05)
-
-        except GeneratorExit:
-            # Clean up when client disconnects
-            web_logger.debug(f"Client {client_id} disconnected from log stream for {app_type}. Cleaning up.")
-        except Exception as e:
-            web_logger.error(f"Unhandled error in log stream generator for {app_type} (Client: {client_ip}): {e}", exc_info=True)
-            try:
-                # Ensure error message is properly formatted for SSE
-                yield f"event: error\ndata: ERROR: Log streaming failed unexpectedly: {str(e)}\n\n"
-            except Exception as yield_err:
-                 web_logger.error(f"Error yielding final error message to client {client_id}: {yield_err}")
-        finally:
-            # Ensure cleanup happens regardless of how the generator exits
-            with app.log_stream_lock:
-                removed_client = app.active_log_streams.pop(client_id, None)
-                if removed_client:
-                     web_logger.debug(f"Successfully removed client {client_id} from active log streams.")
-                else:
-                     web_logger.debug(f"Client {client_id} was already removed from active log streams before finally block.")
-            web_logger.debug(f"Log stream generator finished for {app_type} (Client: {client_id})")
-
-    # Return the SSE response with appropriate headers for better streaming
-    response = Response(stream_with_context(generate()), mimetype='text/event-stream') # Use stream_with_context
-    response.headers['Cache-Control'] = 'no-cache'
-    response.headers['X-Accel-Buffering'] = 'no'  # Disable nginx buffering if using nginx
-    return response
-
 # Legacy file-based logs route removed - now using database-based log routes in log_routes.py
 # The frontend should use /api/logs endpoints instead
 
@@ -566,10 +392,53 @@ def api_settings():
         all_settings = settings_manager.get_all_settings() # Corrected function name
         return jsonify(all_settings)
 
+# Single background worker for slow container-side work triggered from the settings UI.
+# One worker keeps timezone applies in submission order so the latest request always wins.
+_background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bgwork")
+_timezone_apply = {'timezone': None, 'future': None}
+_timezone_apply_lock = Lock()
+
+def _apply_timezone_change(new_timezone):
+    """
+    Apply a saved timezone and refresh logger formatters (runs on the background worker)
+    
+    Args:
+        new_timezone: The timezone to apply
+        
+    Returns:
+        bool: True if the timezone was applied
+    """
+    try:
+        web_logger.info(f"Applying timezone change to {new_timezone}")
+        timezone_success = settings_manager.apply_timezone(new_timezone)
+        if timezone_success:
+            web_logger.info(f"Successfully applied timezone {new_timezone}")
+            # Refresh all logger formatters to use the new timezone
+            try:
+                refresh_timezone_formatters()
+                web_logger.info("Timezone formatters refreshed for all loggers")
+            except Exception as e:
+                web_logger.warning(f"Failed to refresh timezone formatters: {e}")
+        else:
+            web_logger.warning(f"Failed to apply timezone {new_timezone}, but settings saved")
+        return bool(timezone_success)
+    except Exception as e:
+        web_logger.error(f"Error applying timezone: {e}")
+        # Continue anyway - settings were still saved
+        return False
+
+def _submit_timezone_apply(new_timezone):
+    """Queue a timezone apply and record it as the latest one for the status endpoint"""
+    # Submitting under the lock keeps the recorded pair in the same order as the worker queue
+    with _timezone_apply_lock:
+        future = _background_executor.submit(_apply_timezone_change, new_timezone)
+        _timezone_apply['timezone'] = new_timezone
+        _timezone_apply['future'] = future
+    return future
+
 @app.route('/api/settings/general', methods=['POST'])
 def save_general_settings():
-    general_logger = get_logger("web_server")
-    general_logger.info("Received request to save general settings.")
+    web_logger.info("Received request to save general settings.")
     
     # Make sure we have data
     if not request.is_json:
@@ -578,9 +447,9 @@ def save_general_settings():
     data = request.json
     
     # Debug: Log the incoming data to see if timezone is present
-    general_logger.debug(f"Received general settings data: {data}")
+    web_logger.debug(f"Received general settings data: {data}")
     if 'timezone' in data:
-        general_logger.info(f"Timezone setting found: {data.get('timezone')}")
+        web_logger.info(f"Timezone setting found: {data.get('timezone')}")
     
     # Ensure auth_mode and bypass flags are consistent
     auth_mode = data.get('auth_mode')
@@ -608,53 +477,43 @@ def save_general_settings():
         # Validate the new timezone
         safe_timezone = settings_manager.get_safe_timezone(new_timezone)
         if safe_timezone != new_timezone:
-            general_logger.warning(f"Invalid timezone '{new_timezone}' provided, using '{safe_timezone}' instead")
+            web_logger.warning(f"Invalid timezone '{new_timezone}' provided, using '{safe_timezone}' instead")
             data['timezone'] = safe_timezone  # Update the data to save the safe timezone
             new_timezone = safe_timezone
         
         if current_timezone != new_timezone:
             timezone_changed = True
-            general_logger.info(f"Timezone changed from {current_timezone} to {new_timezone}")
+            web_logger.info(f"Timezone changed from {current_timezone} to {new_timezone}")
     
     # Save general settings
     success = settings_manager.save_settings('general', data)
     
     if success:
-        # Apply timezone change if needed
+        # Apply timezone change in the background - settings are already saved,
+        # so the response doesn't need to wait for zoneinfo and logger updates.
+        # The shared worker runs applies in save order.
         if timezone_changed:
-            try:
-                general_logger.info(f"Applying timezone change to {new_timezone}")
-                timezone_success = settings_manager.apply_timezone(new_timezone)
-                if timezone_success:
-                    general_logger.info(f"Successfully applied timezone {new_timezone}")
-                    # Refresh all logger formatters to use the new timezone
-                    try:
-                        from src.primary.utils.logger import refresh_timezone_formatters
-                        refresh_timezone_formatters()
-                        general_logger.info("Timezone formatters refreshed for all loggers")
-                    except Exception as e:
-                        general_logger.warning(f"Failed to refresh timezone formatters: {e}")
-                else:
-                    general_logger.warning(f"Failed to apply timezone {new_timezone}, but settings saved")
-            except Exception as e:
-                general_logger.error(f"Error applying timezone: {e}")
-                # Continue anyway - settings were still saved
+            _submit_timezone_apply(new_timezone)
         
         # Update expiration timing from general settings if applicable
         try:
             new_hours = int(data.get('stateful_management_hours'))
             if new_hours > 0:
-                general_logger.info(f"Updating stateful expiration to {new_hours} hours.")
+                web_logger.info(f"Updating stateful expiration to {new_hours} hours.")
                 update_lock_expiration(hours=new_hours)
         except (ValueError, TypeError, KeyError):
             # Don't update if the value wasn't provided or is invalid
             pass
         except Exception as e:
-            general_logger.error(f"Error updating expiration timing: {e}")
+            web_logger.error(f"Error updating expiration timing: {e}")
         
         # Update logging levels immediately when general settings are changed
         update_logging_levels()
-        
+
+        # Refresh the cached base URL only when it was part of this save
+        if 'base_url' in data:
+            refresh_cached_base_url()
+
         # Return all settings
         return jsonify(settings_manager.get_all_settings())
     else:
@@ -663,33 +522,24 @@ def save_general_settings():
 @app.route('/api/test-notification', methods=['POST'])
 def test_notification():
     """Test notification endpoint with enhanced Windows debugging"""
-    import platform
-    web_logger = get_logger("web_server")
-    
     try:
-        from src.primary.notification_manager import send_notification, get_notification_config, apprise_import_error
         
         # Enhanced debugging for Windows issues
-        system_info = {
-            "platform": platform.system(),
-            "platform_release": platform.release(),
-            "python_version": platform.python_version(),
-            "apprise_available": apprise_import_error is None
-        }
+        system_info = {**_SYSTEM_INFO, "apprise_available": apprise_import_error is None}
         
         web_logger.info(f"Test notification requested on {system_info}")
         
         # Check for Apprise import issues first (common Windows problem)
         if apprise_import_error:
             error_msg = f"Apprise library not available: {apprise_import_error}"
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 error_msg += " (Common on Windows - try: pip install apprise)"
             web_logger.error(error_msg)
             return jsonify({
                 "success": False, 
                 "error": error_msg,
                 "system_info": system_info
-            }), 500, {'Content-Type': 'application/json'}
+            }), 500
         
         # Get the user's configured notification level
         config = get_notification_config()
@@ -703,43 +553,45 @@ def test_notification():
         )
         
         if success:
-            web_logger.info(f"Test notification sent successfully on {platform.system()}")
-            return jsonify({"success": True, "message": "Test notification sent successfully!"}), 200, {'Content-Type': 'application/json'}
+            web_logger.info(f"Test notification sent successfully on {_SYSTEM_INFO['platform']}")
+            return jsonify({"success": True, "message": "Test notification sent successfully!"})
         else:
             error_msg = "Failed to send test notification. Check your Apprise URLs and settings."
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 error_msg += " On Windows, ensure Apprise is properly installed and all dependencies are available."
             web_logger.warning(f"Test notification failed: {error_msg}")
             return jsonify({
                 "success": False, 
                 "error": error_msg,
                 "system_info": system_info
-            }), 500, {'Content-Type': 'application/json'}
+            }), 500
             
     except Exception as e:
         error_msg = f"Error sending test notification: {str(e)}"
-        web_logger.error(f"{error_msg} | System: {platform.system()}")
+        web_logger.error(f"{error_msg} | System: {_SYSTEM_INFO['platform']}")
         return jsonify({
             "success": False, 
             "error": error_msg,
             "system_info": {
-                "platform": platform.system(),
-                "python_version": platform.python_version()
+                "platform": _SYSTEM_INFO["platform"],
+                "python_version": _SYSTEM_INFO["python_version"]
             }
-        }), 500, {'Content-Type': 'application/json'}
+        }), 500
+
+# Trailing whitespace, slashes and backslashes are trimmed from saved API URLs
+_URL_TRAIL_RE = re.compile(r'[\s/\\]+$')
 
 @app.route('/api/settings/<app_name>', methods=['GET', 'POST'])
 def handle_app_settings(app_name):
-    web_logger = get_logger("web_server")
     
     # Validate app_name
-    if app_name not in settings_manager.KNOWN_APP_TYPES:
+    if app_name not in settings_manager.KNOWN_APP_TYPE_SET:
         return jsonify({"success": False, "error": f"Unknown application type: {app_name}"}), 400
     
     if request.method == 'GET':
         # Return settings for the specific app
         app_settings = settings_manager.load_settings(app_name)
-        return jsonify(app_settings)
+        return _conditional_response(orjson.dumps(app_settings))
     
     elif request.method == 'POST':
         # Make sure we have data
@@ -750,14 +602,15 @@ def handle_app_settings(app_name):
         # Auto-save request received - debug spam removed
         
         # Clean URLs in the data before saving
+        strip_url_trail = _URL_TRAIL_RE.sub
         if 'instances' in data and isinstance(data['instances'], list):
             for instance in data['instances']:
                 if 'api_url' in instance and instance['api_url']:
                     # Remove trailing slashes and special characters
-                    instance['api_url'] = instance['api_url'].strip().rstrip('/').rstrip('\\')
+                    instance['api_url'] = strip_url_trail('', instance['api_url'].lstrip())
         elif 'api_url' in data and data['api_url']:
             # For apps that don't use instances array
-            data['api_url'] = data['api_url'].strip().rstrip('/').rstrip('\\')
+            data['api_url'] = strip_url_trail('', data['api_url'].lstrip())
         
         # Settings cleaned - debug spam removed
         
@@ -787,9 +640,8 @@ def api_theme():
 def api_reset_settings():
     data = request.json
     app_name = data.get('app')
-    web_logger = get_logger("web_server")
 
-    if not app_name or app_name not in settings_manager.KNOWN_APP_TYPES: # Corrected attribute name
+    if not app_name or app_name not in settings_manager.KNOWN_APP_TYPE_SET: # Corrected attribute name
         return jsonify({"success": False, "error": f"Invalid or missing app name: {app_name}"}), 400
 
     web_logger.info(f"Resetting settings for {app_name} to defaults.")
@@ -812,7 +664,7 @@ def api_reset_settings():
 @app.route('/api/app-settings', methods=['GET'])
 def api_app_settings():
     app_type = request.args.get('app')
-    if not app_type or app_type not in settings_manager.KNOWN_APP_TYPES: # Corrected attribute name
+    if not app_type or app_type not in settings_manager.KNOWN_APP_TYPE_SET: # Corrected attribute name
         return jsonify({"success": False, "error": f"Invalid or missing app type: {app_type}"}), 400
 
     # Get API credentials using the updated settings_manager function
@@ -822,70 +674,112 @@ def api_app_settings():
     api_details = {"api_url": api_url, "api_key": api_key}
     return jsonify({"success": True, **api_details})
 
+def _conditional_response(body, mimetype='application/json'):
+    """
+    Wrap a pre-serialized body in a response carrying a content hash ETag.
+    
+    Polling clients that send a matching If-None-Match get an empty 304 instead of the payload.
+    
+    Args:
+        body: Response body as bytes
+        mimetype: Mimetype of the body
+        
+    Returns:
+        A Response, converted to 304 Not Modified when the client's copy is current
+    """
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(hashlib.blake2b(body, digest_size=16).hexdigest())
+    # Clients may keep the body but must revalidate it on every poll
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
 @app.route('/api/configured-apps', methods=['GET'])
 def api_configured_apps():
     # Return the configured status of all apps using the updated settings_manager function
     configured_apps_list = settings_manager.get_configured_apps() # Corrected function name
     # Convert list to dict format expected by frontend
     configured_status = {app: (app in configured_apps_list) for app in settings_manager.KNOWN_APP_TYPES}
-    return jsonify(configured_status)
+    return _conditional_response(orjson.dumps(configured_status))
+
+# Apps whose status is checked per configured instance, and apps whose cycle can be reset from the UI
+_MULTI_INSTANCE_APPS = frozenset(('sonarr', 'radarr', 'lidarr', 'readarr', 'whisparr', 'eros'))
+_RESETTABLE_APPS = _MULTI_INSTANCE_APPS | {'swaparr'}
+
+# Worker pool for per-instance connection checks in the status endpoint
+_status_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="status")
+
+@functools.lru_cache(maxsize=None)
+def _get_app_api(app_name):
+    """
+    Import an app's package and API module once and return its status-check callables.
+    
+    Returns:
+        tuple: (get_configured_instances, check_connection), either of which may be None
+    """
+    module_name = f'src.primary.apps.{app_name}'
+    instances_module = importlib.import_module(module_name)
+    api_module = importlib.import_module(f'{module_name}.api')
+    return getattr(instances_module, 'get_configured_instances', None), getattr(api_module, 'check_connection', None)
 
 # --- Add Status Endpoint --- #
 @app.route('/api/status/<app_name>', methods=['GET'])
 def api_app_status(app_name):
     """Check connection status for a specific app."""
-    web_logger = get_logger("web_server")
     response_data = {"configured": False, "connected": False} # Default for non-Sonarr apps
     status_code = 200
     
     # First validate the app name
-    if app_name not in settings_manager.KNOWN_APP_TYPES:
+    if app_name not in settings_manager.KNOWN_APP_TYPE_SET:
         web_logger.warning(f"Status check requested for invalid app name: {app_name}")
         return jsonify({"configured": False, "connected": False, "error": "Invalid app name"}), 400
     
     try:
-        if app_name in ['sonarr', 'radarr', 'lidarr', 'readarr', 'whisparr', 'eros']:
+        if app_name in _MULTI_INSTANCE_APPS:
             # --- Multi-Instance Status Check --- # 
             connected_count = 0
             total_configured = 0
             try:
-                # Import app specific functions
-                module_name = f'src.primary.apps.{app_name}'
-                instances_module = importlib.import_module(module_name)
-                api_module = importlib.import_module(f'{module_name}.api')
-                
-                if hasattr(instances_module, 'get_configured_instances'):
-                    get_instances_func = getattr(instances_module, 'get_configured_instances')
+                # Resolve app specific functions (memoized after the first status check)
+                get_instances_func, check_connection_func = _get_app_api(app_name)
+            except ImportError as e:
+                web_logger.error(f"Failed to import {app_name} modules for status check: {e}")
+                return jsonify({"total_configured": 0, "connected_count": 0, "error": "Import Error"}), 500
+            
+            try:
+                if get_instances_func:
                     instances = get_instances_func()
                     total_configured = len(instances)
                     api_timeout = settings_manager.get_setting(app_name, "api_timeout", 10) # Get global timeout
                     
                     if total_configured > 0:
                         web_logger.debug(f"Checking connection for {total_configured} {app_name.capitalize()} instances...")
-                        if hasattr(api_module, 'check_connection'):
-                            check_connection_func = getattr(api_module, 'check_connection')
-                            for instance in instances:
-                                inst_url = instance.get("api_url")
-                                inst_key = instance.get("api_key")
-                                inst_name = instance.get("instance_name", "Default")
-                                try:
-                                    # Use a short timeout per instance check
-                                    if check_connection_func(inst_url, inst_key, min(api_timeout, 5)):
-                                        web_logger.debug(f"{app_name.capitalize()} instance '{inst_name}' connected successfully.")
-                                        connected_count += 1
-                                    else:
-                                        web_logger.debug(f"{app_name.capitalize()} instance '{inst_name}' connection check failed.")
-                                except Exception as e:
-                                    web_logger.error(f"Error checking connection for {app_name.capitalize()} instance '{inst_name}': {str(e)}")
+                        if check_connection_func:
+                            # Check all instances concurrently with a short timeout each
+                            check_timeout = min(api_timeout, 5)
+                            futures = {
+                                _status_executor.submit(check_connection_func, instance.get("api_url"), instance.get("api_key"), check_timeout):
+                                    instance.get("instance_name", "Default")
+                                for instance in instances
+                            }
+                            try:
+                                for future in as_completed(futures, timeout=check_timeout + 2):
+                                    inst_name = futures[future]
+                                    try:
+                                        if future.result():
+                                            web_logger.debug(f"{app_name.capitalize()} instance '{inst_name}' connected successfully.")
+                                            connected_count += 1
+                                        else:
+                                            web_logger.debug(f"{app_name.capitalize()} instance '{inst_name}' connection check failed.")
+                                    except Exception as e:
+                                        web_logger.error(f"Error checking connection for {app_name.capitalize()} instance '{inst_name}': {str(e)}")
+                            except FuturesTimeoutError:
+                                # Instances that haven't answered by now are reported as not connected
+                                web_logger.warning(f"Timed out waiting for {app_name.capitalize()} connection checks")
                         else:
                             web_logger.warning(f"check_connection function not found in {app_name} API module")
                 
                 # Prepare multi-instance response
                 response_data = {"total_configured": total_configured, "connected_count": connected_count}
-            except Exception as e:
-                web_logger.error(f"Failed to import {app_name} modules for status check: {e}")
-                response_data = {"total_configured": 0, "connected_count": 0, "error": "Import Error"}
-                status_code = 500
             except Exception as e:
                 web_logger.error(f"Error during {app_name} multi-instance status check: {e}", exc_info=True)
                 response_data = {"total_configured": total_configured, "connected_count": connected_count, "error": "Check Error"}
@@ -901,15 +795,13 @@ def api_app_status(app_name):
 
             if is_configured:
                 try:
-                    module_path = f'src.primary.apps.{app_name}.api'
-                    api_module = importlib.import_module(module_path)
+                    _, check_connection_func = _get_app_api(app_name)
                     
-                    if hasattr(api_module, 'check_connection'):
-                        check_connection_func = getattr(api_module, 'check_connection')
+                    if check_connection_func:
                         # Use a short timeout to prevent long waits
                         is_connected = check_connection_func(api_url, api_key, min(api_timeout, 5))
                     else:
-                        web_logger.warning(f"check_connection function not found in {module_path}")
+                        web_logger.warning(f"check_connection function not found in src.primary.apps.{app_name}.api")
                 except ImportError:
                     web_logger.error(f"Could not import API module for {app_name}")
                     is_connected = False # Ensure connection is false on import error
@@ -931,10 +823,9 @@ def api_app_status(app_name):
 
 @app.route('/api/settings/apply-timezone', methods=['POST'])
 def apply_timezone_setting():
-    """Apply timezone setting to the container."""
+    """Save the timezone setting and apply it to the container in the background."""
     data = request.json
     timezone = data.get('timezone')
-    web_logger = get_logger("web_server")
 
     if not timezone:
         return jsonify({"success": False, "error": "No timezone specified"}), 400
@@ -946,34 +837,40 @@ def apply_timezone_setting():
     general_settings["timezone"] = timezone
     settings_manager.save_settings("general", general_settings)
     
-    # Apply the timezone to the container
-    success = settings_manager.apply_timezone(timezone)
+    # Apply the timezone to the container without holding up the response;
+    # clients poll /api/settings/apply-timezone/status for the outcome
+    _submit_timezone_apply(timezone)
     
-    if success:
-        return jsonify({"success": True, "message": f"Timezone set to {timezone}. Container restart may be required for full effect."})
-    else:
-        return jsonify({"success": False, "error": f"Failed to apply timezone {timezone}"}), 500
+    return jsonify({"pending": True, "timezone": timezone, "message": f"Timezone set to {timezone}. Container restart may be required for full effect."}), 202
+
+@app.route('/api/settings/apply-timezone/status', methods=['GET'])
+def apply_timezone_status():
+    """Report the result of the most recent background timezone apply."""
+    with _timezone_apply_lock:
+        timezone = _timezone_apply['timezone']
+        future = _timezone_apply['future']
+    if future is None:
+        return jsonify({"pending": False, "timezone": None, "success": None})
+    if not future.done():
+        return jsonify({"pending": True, "timezone": timezone, "success": None})
+    try:
+        success = bool(future.result())
+    except Exception as e:
+        web_logger.error(f"Error applying timezone {timezone}: {e}")
+        success = False
+    return jsonify({"pending": False, "timezone": timezone, "success": success})
 
 @app.route('/api/hourly-caps', methods=['GET'])
 def api_get_hourly_caps():
     """Get hourly API usage caps for each app"""
     try:
-        # Import necessary functions
-        from src.primary.stats_manager import load_hourly_caps
-        from src.primary.settings_manager import load_settings
-        
-        # Get the logger
-        web_logger = get_logger("web_server")
-        
         # Load the current hourly caps
         caps = load_hourly_caps()
         
         # Get app-specific hourly cap limits
-        app_limits = {}
         apps = ['sonarr', 'radarr', 'lidarr', 'readarr', 'whisparr', 'eros']
-        for app in apps:
-            app_settings = load_settings(app)
-            app_limits[app] = app_settings.get('hourly_cap', 20)  # Default to 20 if not set
+        all_app_settings = settings_manager.load_settings_many(apps)
+        app_limits = {app: all_app_settings[app].get('hourly_cap', 20) for app in apps}  # Default to 20 if not set
         
         return jsonify({
             "success": True,
@@ -981,7 +878,6 @@ def api_get_hourly_caps():
             "limits": app_limits
         })
     except Exception as e:
-        web_logger = get_logger("web_server")
         web_logger.error(f"Error retrieving hourly API caps: {e}")
         return jsonify({
             "success": False,
@@ -995,12 +891,6 @@ def api_reset_stats_public():
         data = request.json or {}
         app_type = data.get('app_type')
         
-        # Get logger for logging the reset action
-        web_logger = get_logger("web_server")
-        
-        # Import the reset_stats function
-        from src.primary.stats_manager import reset_stats
-        
         if app_type:
             web_logger.info(f"Resetting statistics for app (public): {app_type}")
             reset_success = reset_stats(app_type)
@@ -1014,7 +904,6 @@ def api_reset_stats_public():
             return jsonify({"success": False, "error": "Failed to reset statistics"}), 500
         
     except Exception as e:
-        web_logger = get_logger("web_server")
         web_logger.error(f"Error resetting statistics (public): {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -1022,12 +911,10 @@ def api_reset_stats_public():
 def version_txt():
     """Serve version from database"""
     try:
-        from src.primary.utils.database import get_database
         db = get_database()
         version = db.get_version()
-        return version, 200, {'Content-Type': 'text/plain', 'Cache-Control': 'no-cache'}
+        return _conditional_response(version.encode(), mimetype='text/plain')
     except Exception as e:
-        web_logger = get_logger("web_server")
         web_logger.error(f"Error serving version from database: {e}")
         return "N/A", 200, {'Content-Type': 'text/plain', 'Cache-Control': 'no-cache'}
 
@@ -1035,11 +922,9 @@ def version_txt():
 def api_get_all_cycle_status():
     """API endpoint to get cycle status for all apps."""
     try:
-        from src.primary.cycle_tracker import get_cycle_status
         status = get_cycle_status()
-        return jsonify(status), 200
+        return _conditional_response(orjson.dumps(status))
     except Exception as e:
-        web_logger = get_logger("web_server")
         web_logger.error(f"Error getting cycle status: {e}")
         return jsonify({"error": "Failed to retrieve cycle status information."}), 500
 
@@ -1047,11 +932,9 @@ def api_get_all_cycle_status():
 def api_get_app_cycle_status(app_name):
     """API endpoint to get cycle status for a specific app."""
     try:
-        from src.primary.cycle_tracker import get_cycle_status
         status = get_cycle_status(app_name)
         return jsonify(status), 200
     except Exception as e:
-        web_logger = get_logger("web_server")
         web_logger.error(f"Error getting cycle status for {app_name}: {e}")
         return jsonify({"error": f"Failed to retrieve cycle status for {app_name}."}), 500
 
@@ -1066,12 +949,10 @@ def reset_app_cycle(app_name):
     Returns:
         JSON response with success/error status
     """
-    # Make sure to initialize web_logger if it's not available in this scope
-    web_logger = get_logger("web_server")
     web_logger.info(f"Manual cycle reset requested for {app_name} via API")
     
     # Check if app name is valid
-    if app_name not in ['sonarr', 'radarr', 'lidarr', 'readarr', 'whisparr', 'eros', 'swaparr']:
+    if app_name not in _RESETTABLE_APPS:
         return jsonify({
             'success': False,
             'error': f"Invalid app name: {app_name}"
@@ -1080,8 +961,7 @@ def reset_app_cycle(app_name):
     # Check if the app is configured (special handling for Swaparr)
     if app_name == 'swaparr':
         # For Swaparr, check if it's enabled in settings
-        from src.primary.settings_manager import load_settings
-        swaparr_settings = load_settings("swaparr")
+        swaparr_settings = settings_manager.load_settings("swaparr")
         if not swaparr_settings or not swaparr_settings.get("enabled", False):
             return jsonify({
                 'success': False,
@@ -1098,7 +978,6 @@ def reset_app_cycle(app_name):
         
     try:
         # Trigger cycle reset using database
-        from src.primary.utils.database import get_database
         
         db = get_database()
         success = db.create_reset_request(app_name)
@@ -1123,6 +1002,10 @@ def reset_app_cycle(app_name):
         }), 500
 
 # Docker health check endpoint
+# Health probe payloads never change, so encode them once
+_PING_RESPONSE_BODY = orjson.dumps({"status": "OK"})
+_HEALTH_RESPONSE_BODY = orjson.dumps({"status": "OK", "message": "Huntarr is running"})
+
 @app.route('/ping', methods=['GET'])
 def health_check():
     """
@@ -1130,9 +1013,8 @@ def health_check():
     Returns a status OK response to indicate the application is running properly.
     This follows the pattern of other *arr applications.
     """
-    logger = get_logger("system")
-    logger.debug("Health check endpoint accessed")
-    return jsonify({"status": "OK"})
+    system_logger.debug("Health check endpoint accessed")
+    return Response(_PING_RESPONSE_BODY, mimetype='application/json')
 
 @app.route('/api/health', methods=['GET'])
 def api_health_check():
@@ -1141,16 +1023,85 @@ def api_health_check():
     Returns a status OK response to indicate the application is running properly.
     This endpoint is useful for monitoring tools and load balancers.
     """
-    logger = get_logger("system")
-    logger.debug("API health check endpoint accessed")
-    return jsonify({"status": "OK", "message": "Huntarr is running"})
+    system_logger.debug("API health check endpoint accessed")
+    return Response(_HEALTH_RESPONSE_BODY, mimetype='application/json')
+
+# Serialized sponsors payload; sponsor data only changes when save_sponsors runs
+_sponsors_cache = {'timestamp': 0, 'body': None}
+SPONSORS_CACHE_TTL = 3600  # seconds
+
+def clear_sponsors_cache():
+    """Drop the cached sponsors payload so the next request rebuilds it from the database"""
+    _sponsors_cache['body'] = None
+
+SPONSORS_MANIFEST_URL = "https://raw.githubusercontent.com/plexguide/Huntarr.io/main/manifest.json"
+
+# Pooled session for the GitHub manifest fallback; the lock keeps a single fetch in flight
+_manifest_session = requests.Session()
+_sponsors_bootstrap_lock = threading.Lock()
+
+def _bootstrap_sponsors_from_github():
+    """Populate the sponsors table from the GitHub manifest (runs in a background thread holding _sponsors_bootstrap_lock)"""
+    
+    try:
+        response = _manifest_session.get(SPONSORS_MANIFEST_URL, timeout=10)
+        response.raise_for_status()
+        sponsors_list = orjson.loads(response.content).get('sponsors', [])
+        if sponsors_list:
+            get_database().save_sponsors(sponsors_list)
+            clear_sponsors_cache()
+            web_logger.debug(f"Populated database with {len(sponsors_list)} sponsors from GitHub manifest")
+        else:
+            web_logger.warning("No sponsors found in GitHub manifest")
+    except Exception as e:
+        web_logger.error(f"Error fetching sponsors from GitHub manifest: {e}")
+    finally:
+        _sponsors_bootstrap_lock.release()
+
+@functools.lru_cache(maxsize=4)
+def _load_manifest_cached(path, mtime):
+    """
+    Parse a manifest.json file, memoized on its modification time.
+    
+    Args:
+        path: Path to the manifest file
+        mtime: The file's st_mtime; a new value (i.e. a redeploy) forces a re-read
+    
+    Returns:
+        The parsed manifest (shared between callers, treat as read-only)
+    """
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def _format_sponsors(rows):
+    """Format sponsor rows for the frontend (avatar_url -> avatarUrl, monthly_amount -> monthlyAmount)"""
+    # Use the avatar URL as-is from the database (it's already correct from GitHub)
+    return [{
+        'login': sponsor.get('login', ''),
+        'avatarUrl': sponsor.get('avatar_url', ''),
+        'name': sponsor.get('name', sponsor.get('login', 'Unknown')),
+        'url': sponsor.get('url', '#'),
+        'category': sponsor.get('category', 'past'),
+        'tier': sponsor.get('tier', 'Supporter'),
+        'monthlyAmount': sponsor.get('monthly_amount', 0)
+    } for sponsor in rows]
+
+def _sponsors_response(rows):
+    """Serialize sponsor rows, remember the body in the sponsors cache and return it"""
+    body = orjson.dumps(_format_sponsors(rows))
+    _sponsors_cache['timestamp'] = time.monotonic()
+    _sponsors_cache['body'] = body
+    return _conditional_response(body)
 
 @app.route('/api/github_sponsors', methods=['GET'])
 def get_github_sponsors():
     """
     Get sponsors from database. If database is empty, try to populate from manifest or GitHub.
     """
-    from src.primary.utils.database import get_database
+    
+    body = _sponsors_cache['body']
+    if body is not None and time.monotonic() - _sponsors_cache['timestamp'] < SPONSORS_CACHE_TTL:
+        return _conditional_response(body)
     
     try:
         db = get_database()
@@ -1159,22 +1110,8 @@ def get_github_sponsors():
         sponsors = db.get_sponsors()
         
         if sponsors:
-            # Format sponsors for frontend (convert avatar_url to avatarUrl for consistency)
-            formatted_sponsors = []
-            for sponsor in sponsors:
-                # Use the avatar URL as-is from the database (it's already correct from GitHub)
-                formatted_sponsors.append({
-                    'login': sponsor.get('login', ''),
-                    'avatarUrl': sponsor.get('avatar_url', ''),
-                    'name': sponsor.get('name', sponsor.get('login', 'Unknown')),
-                    'url': sponsor.get('url', '#'),
-                    'category': sponsor.get('category', 'past'),
-                    'tier': sponsor.get('tier', 'Supporter'),
-                    'monthlyAmount': sponsor.get('monthly_amount', 0)
-                })
-            
-            current_app.logger.debug(f"Returning {len(formatted_sponsors)} sponsors from database")
-            return jsonify(formatted_sponsors)
+            current_app.logger.debug(f"Returning {len(sponsors)} sponsors from database")
+            return _sponsors_response(sponsors)
         
         # If no sponsors in database, try to populate from manifest
         current_app.logger.debug("No sponsors in database, attempting to populate from manifest")
@@ -1182,18 +1119,26 @@ def get_github_sponsors():
         # Try to use local manifest.json first, then fallback to GitHub
         local_manifest_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'manifest.json')
         
+        try:
+            manifest_mtime = os.stat(local_manifest_path).st_mtime
+        except OSError:
+            manifest_mtime = None
+        
         manifest_data = None
-        if os.path.exists(local_manifest_path):
+        if manifest_mtime is not None:
             current_app.logger.debug(f"Using local manifest.json from {local_manifest_path}")
-            with open(local_manifest_path, 'r') as f:
-                manifest_data = json.load(f)
+            manifest_data = _load_manifest_cached(local_manifest_path, manifest_mtime)
         else:
-            # Fallback to GitHub raw content
-            manifest_url = "https://raw.githubusercontent.com/plexguide/Huntarr.io/main/manifest.json"
-            current_app.logger.debug(f"Local manifest not found, fetching from {manifest_url}")
-            response = requests.get(manifest_url, timeout=10)
-            response.raise_for_status()
-            manifest_data = response.json()
+            # Fallback to GitHub raw content off the request thread; the next request reads the database
+            if _sponsors_bootstrap_lock.acquire(blocking=False):
+                current_app.logger.debug(f"Local manifest not found, fetching from {SPONSORS_MANIFEST_URL} in the background")
+                try:
+                    threading.Thread(target=_bootstrap_sponsors_from_github, name="SponsorsBootstrap", daemon=True).start()
+                except Exception as e:
+                    # The thread never ran, so release the lock here or no later request would retry
+                    _sponsors_bootstrap_lock.release()
+                    current_app.logger.error(f"Could not start sponsors bootstrap: {e}")
+            return jsonify([])
         
         if manifest_data:
             sponsors_list = manifest_data.get('sponsors', [])
@@ -1202,8 +1147,10 @@ def get_github_sponsors():
                 db.save_sponsors(sponsors_list)
                 current_app.logger.debug(f"Populated database with {len(sponsors_list)} sponsors from manifest")
                 
-                # Return the sponsors (recursively call this function to get formatted data)
-                return get_github_sponsors()
+                # Return the freshly stored rows directly
+                sponsors = db.get_sponsors()
+                if sponsors:
+                    return _sponsors_response(sponsors)
         
         # If all else fails, return empty list
         current_app.logger.warning("No sponsors found in database or manifest")
@@ -1217,7 +1164,6 @@ def get_github_sponsors():
 # Start the web server in debug or production mode
 def start_web_server():
     """Start the web server in debug or production mode"""
-    web_logger = get_logger("web_server")
     web_logger.info("--- start_web_server function called ---") # Added log
     debug_mode = os.environ.get('DEBUG', 'false').lower() == 'true'
     host = '0.0.0.0'  # Listen on all interfaces
@@ -1227,6 +1173,15 @@ def start_web_server():
     os.makedirs(LOG_DIR, exist_ok=True)
 
     web_logger.info(f"Attempting to start web server on {host}:{port} (Debug: {debug_mode})") # Modified log
-    # In production, use Werkzeug's simple server or a proper WSGI server
+    # Normally handled by root main.py; direct execution mirrors it: Werkzeug only for debugging, Waitress otherwise
+    if not debug_mode:
+        try:
+            from waitress import serve
+            web_logger.info("--- Calling waitress.serve() ---")
+            serve(app, host=host, port=port, threads=min(32, (os.cpu_count() or 4) * 4),
+                  channel_timeout=60, connection_limit=512)
+            return
+        except ImportError:
+            web_logger.warning("Waitress not found, falling back to the Flask development server")
     web_logger.info("--- Calling app.run() ---") # Added log
-    app.run(host=host, port=port, debug=debug_mode, use_reloader=False) # Keep this line if needed for direct execution testing, but it's now handled by root main.py
\ No newline at end of file
+    app.run(host=host, port=port, debug=debug_mode, use_reloader=False)
\ No newline at end of file
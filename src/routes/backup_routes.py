@@ -350,6 +350,10 @@ class BackupManager:
                     else:
                         raise Exception(f"Restored database {db_name} failed integrity check")
             
+            # Cached settings still reflect the replaced database
+            from src.primary.settings_manager import clear_cache
+            clear_cache()
+            
             logger.info(f"Backup restored successfully: {backup_id}")
             return {
                 'backup_id': backup_id,
@@ -390,6 +394,9 @@ class BackupManager:
                     deleted_databases.append(db_name)
                     logger.warning(f"Deleted database: {db_name}")
             
+            from src.primary.settings_manager import clear_cache
+            clear_cache()
+            
             logger.warning(f"Database deletion completed: {deleted_databases}")
             return deleted_databases
             
@@ -0,0 +1,29 @@
+"""
+Shared test setup for Huntarr.
+Points the config directory at a throwaway location before any src module
+opens the settings or logs databases, and makes the src imports resolve
+the same way main.py does.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, 'src')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Must be set before src.primary.utils.database resolves its database paths
+os.environ['HUNTARR_CONFIG_DIR'] = tempfile.mkdtemp(prefix='huntarr-tests-')
+
+
+@pytest.fixture
+def web_app():
+    """The Huntarr Flask app, configured so request contexts can be built outside a server"""
+    from src.primary.web_server import app
+    app.config['APPLICATION_ROOT'] = '/'
+    return app
@@ -0,0 +1,90 @@
+"""Tests for the orjson-backed Flask JSON provider"""
+
+import dataclasses
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+from flask import Flask, jsonify
+
+from src.primary.utils.json_provider import OrjsonProvider
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.json.sort_keys = False
+    app.json.compact = True
+    return app
+
+
+@dataclasses.dataclass
+class Movie:
+    title: str
+    year: int
+
+
+def test_response_matches_stdlib_encoding(app):
+    payload = {'b': [1, 2.5, None, True], 'a': {'nested': 'ünïcode'}}
+
+    with app.app_context():
+        response = jsonify(payload)
+
+    assert response.mimetype == 'application/json'
+    assert response.get_data().endswith(b'\n')
+    assert json.loads(response.get_data()) == payload
+    # Key order is preserved when sort_keys is off
+    assert list(json.loads(response.get_data())) == ['b', 'a']
+
+
+def test_non_string_keys_are_stringified(app):
+    with app.app_context():
+        assert json.loads(app.json.dumps({1: 'one', 2: 'two'})) == {'1': 'one', '2': 'two'}
+
+
+def test_flask_default_types_keep_their_encoding(app):
+    moment = datetime.datetime(2024, 5, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    ident = uuid.UUID('12345678-1234-5678-1234-567812345678')
+    payload = {'when': moment, 'amount': decimal.Decimal('1.50'), 'id': ident, 'movie': Movie('Heat', 1995)}
+
+    with app.app_context():
+        encoded = json.loads(app.json.dumps(payload))
+
+    assert encoded == {
+        'when': 'Wed, 01 May 2024 12:00:00 GMT',
+        'amount': '1.50',
+        'id': str(ident),
+        'movie': {'title': 'Heat', 'year': 1995}
+    }
+
+
+def test_sort_keys_option_is_honoured(app):
+    app.json.sort_keys = True
+
+    with app.app_context():
+        assert app.json.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+
+def test_explicit_dumps_options_fall_back_to_stdlib(app):
+    with app.app_context():
+        assert app.json.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_loads_accepts_str_and_bytes(app):
+    assert app.json.loads('{"a": 1}') == {'a': 1}
+    assert app.json.loads(b'[1, 2]') == [1, 2]
+
+
+def test_debug_mode_keeps_pretty_printed_responses():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.json.compact = None
+    app.debug = True
+
+    with app.app_context():
+        response = jsonify({'a': 1})
+
+    assert response.get_data() == b'{\n  "a": 1\n}\n'
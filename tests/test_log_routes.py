@@ -0,0 +1,34 @@
+"""Tests for the log viewer API routes"""
+
+import pytest
+
+from src.primary.routes import log_routes
+
+
+def test_unknown_app_type_is_rejected(web_app):
+    with web_app.test_request_context('/api/logs/not-an-app'):
+        response, status = log_routes.get_logs('not-an-app')
+
+    assert status == 400
+    assert response.get_json() == {
+        'success': False,
+        'error': 'Invalid app type: not-an-app',
+        'logs': [],
+        'total': 0
+    }
+
+
+@pytest.mark.parametrize("app_type", sorted(log_routes.VALID_LOG_APP_TYPES))
+def test_known_app_types_are_served(web_app, app_type):
+    log_routes.clear_log_page_cache()
+    with web_app.test_request_context(f'/api/logs/{app_type}'):
+        response = log_routes.get_logs(app_type)
+
+    assert response.status_code == 200
+    assert response.get_json()['success'] is True
+
+
+def test_valid_app_types_cover_every_log_file_plus_all_and_system():
+    from src.primary.utils.logger import APP_LOG_FILES
+
+    assert log_routes.VALID_LOG_APP_TYPES == frozenset(APP_LOG_FILES) | {'all', 'system'}
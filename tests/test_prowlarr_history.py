@@ -0,0 +1,66 @@
+"""Tests for the size-capped JSON reader used by the Prowlarr history fetch"""
+
+import orjson
+
+from src.primary.apps import prowlarr_routes
+
+
+class FakeStreamedResponse:
+    """Minimal stand-in for a streamed requests.Response"""
+
+    def __init__(self, body, content_length=None, chunk_size=4):
+        self._body = body
+        self._chunk_size = chunk_size
+        self.headers = {}
+        if content_length is not None:
+            self.headers['Content-Length'] = str(content_length)
+        self.closed = False
+        self.bytes_read = 0
+
+    def iter_content(self, chunk_size=None):
+        for start in range(0, len(self._body), self._chunk_size):
+            chunk = self._body[start:start + self._chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_reads_body_within_cap():
+    payload = [{'id': 1, 'successful': True}, {'id': 2, 'successful': False}]
+    body = orjson.dumps(payload)
+    response = FakeStreamedResponse(body, content_length=len(body))
+
+    assert prowlarr_routes._read_capped_json(response, max_bytes=len(body)) == payload
+    assert response.closed
+
+
+def test_rejects_oversized_content_length_without_reading():
+    response = FakeStreamedResponse(b'[]', content_length=5000)
+
+    assert prowlarr_routes._read_capped_json(response, max_bytes=100) is None
+    assert response.bytes_read == 0
+    assert response.closed
+
+
+def test_stops_streaming_once_cap_is_exceeded():
+    # No Content-Length (e.g. chunked transfer), so the cap is enforced while reading
+    body = orjson.dumps(list(range(1000)))
+    response = FakeStreamedResponse(body, chunk_size=16)
+
+    assert prowlarr_routes._read_capped_json(response, max_bytes=64) is None
+    assert response.bytes_read < len(body)
+    assert response.closed
+
+
+def test_ignores_non_numeric_content_length():
+    body = orjson.dumps({'records': []})
+    response = FakeStreamedResponse(body)
+    response.headers['Content-Length'] = 'unknown'
+
+    assert prowlarr_routes._read_capped_json(response, max_bytes=1024) == {'records': []}
+
+
+def test_history_cap_is_four_megabytes():
+    assert prowlarr_routes.HISTORY_MAX_BYTES == 4 * 1024 * 1024
@@ -0,0 +1,74 @@
+"""Tests for the pure helpers in the Radarr upgrade cycle"""
+
+import datetime
+import random
+
+import pytest
+
+from src.primary.apps.radarr import upgrade
+
+
+@pytest.mark.parametrize("n, k", [(100, 5), (100, 25), (100, 26), (100, 90), (10, 10), (10, 0)])
+def test_random_subset_picks_k_distinct_items(n, k):
+    items = [f"movie-{i}" for i in range(n)]
+
+    subset = upgrade._random_subset(items, k)
+
+    assert len(subset) == k
+    assert len(set(subset)) == k
+    assert set(subset) <= set(items)
+
+
+def test_random_subset_does_not_modify_input():
+    items = list(range(20))
+
+    upgrade._random_subset(items, 15)
+
+    assert items == list(range(20))
+
+
+def test_random_subset_shuffle_path_reaches_every_item():
+    # k is a large share of the list, so the truncated Fisher-Yates branch is used
+    random.seed(1234)
+    items = list(range(8))
+    seen = set()
+    for _ in range(200):
+        seen.update(upgrade._random_subset(items, 6))
+
+    assert seen == set(items)
+
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize("date_str, expected", [
+    ("2024-05-01T00:00:00Z", datetime.datetime(2024, 5, 1, tzinfo=UTC)),
+    ("2024-05-01T12:30:45.123Z", datetime.datetime(2024, 5, 1, 12, 30, 45, 123000, tzinfo=UTC)),
+    ("2024-05-01T12:30:45", datetime.datetime(2024, 5, 1, 12, 30, 45, tzinfo=UTC)),
+    ("2024-05-01", datetime.datetime(2024, 5, 1, tzinfo=UTC)),
+])
+def test_parse_release_date_returns_aware_utc(date_str, expected):
+    parsed = upgrade._parse_release_date(date_str)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == datetime.timedelta(0)
+
+
+@pytest.mark.parametrize("date_str", [None, "", "   ", "not a date", "2024-13-45"])
+def test_parse_release_date_rejects_missing_or_invalid(date_str):
+    assert upgrade._parse_release_date(date_str) is None
+
+
+def test_parse_release_date_matches_general_parser_for_z_dates():
+    # The fromisoformat fast path must agree with the strptime formats it replaces
+    from src.primary.utils.date_utils import parse_date
+
+    for date_str in ("2023-01-02T03:04:05Z", "2023-01-02T03:04:05.678901Z"):
+        assert upgrade._parse_release_date(date_str) == parse_date(date_str)
+
+
+def test_parsed_dates_compare_with_utc_thresholds():
+    now = datetime.datetime.now(UTC)
+
+    assert upgrade._parse_release_date("2000-01-01") < now
+    assert upgrade._parse_release_date("2999-01-01T00:00:00Z") > now
@@ -0,0 +1,55 @@
+"""Tests for batched settings loading in settings_manager"""
+
+import pytest
+
+from src.primary import settings_manager
+
+APPS = ['sonarr', 'radarr', 'lidarr', 'readarr', 'whisparr', 'eros']
+
+
+@pytest.fixture(autouse=True)
+def empty_settings_cache():
+    settings_manager.clear_cache()
+    yield
+    settings_manager.clear_cache()
+
+
+def test_load_settings_many_matches_single_loads():
+    batched = settings_manager.load_settings_many(APPS)
+
+    settings_manager.clear_cache()
+    assert batched == {app: settings_manager.load_settings(app) for app in APPS}
+
+
+def test_load_settings_many_fills_the_settings_cache():
+    batched = settings_manager.load_settings_many(['sonarr', 'radarr'])
+
+    assert settings_manager.settings_cache['sonarr']['data'] is batched['sonarr']
+    assert settings_manager.load_settings('radarr') is batched['radarr']
+
+
+def test_load_settings_many_serves_cached_entries():
+    cached = settings_manager.load_settings('sonarr')
+
+    assert settings_manager.load_settings_many(['sonarr'])['sonarr'] is cached
+
+
+def test_load_settings_many_sees_saved_changes():
+    settings = settings_manager.load_settings('lidarr')
+    original_cap = settings.get('hourly_cap', 20)
+    try:
+        settings_manager.save_settings('lidarr', {**settings, 'hourly_cap': original_cap + 5})
+
+        assert settings_manager.load_settings_many(['lidarr'])['lidarr']['hourly_cap'] == original_cap + 5
+    finally:
+        settings_manager.save_settings('lidarr', {**settings, 'hourly_cap': original_cap})
+
+
+def test_load_settings_many_fills_defaults_for_missing_keys():
+    settings = settings_manager.load_settings('whisparr')
+    defaults = settings_manager.load_default_app_settings('whisparr')
+    trimmed = {key: value for key, value in settings.items() if key != 'hourly_cap'}
+    settings_manager.get_database().save_app_config('whisparr', trimmed)
+    settings_manager.clear_cache()
+
+    assert settings_manager.load_settings_many(['whisparr'])['whisparr']['hourly_cap'] == defaults['hourly_cap']
@@ -0,0 +1,91 @@
+"""Tests for the batched processed-ID helpers in stateful_manager"""
+
+import uuid
+
+import pytest
+
+from src.primary import settings_manager
+from src.primary import stateful_manager
+
+
+@pytest.fixture
+def instance_name():
+    """A fresh instance name so each test starts with an empty processed list"""
+    return f"test-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def disable_state_management():
+    """Return a function that disables state management for a Radarr instance, restoring settings afterwards"""
+    original = settings_manager.load_settings('radarr', use_cache=False)
+
+    def disable(instance_name):
+        settings = dict(original)
+        settings['instances'] = list(original.get('instances', [])) + [
+            {'name': instance_name, 'state_management_mode': 'disabled'}
+        ]
+        settings_manager.save_settings('radarr', settings)
+
+    yield disable
+    settings_manager.save_settings('radarr', original)
+
+
+def test_bulk_check_returns_only_processed_ids(instance_name):
+    stateful_manager.add_processed_id('radarr', instance_name, '1')
+    stateful_manager.add_processed_id('radarr', instance_name, '3')
+
+    found = stateful_manager.is_processed_bulk('radarr', instance_name, ['1', '2', '3', '4'])
+
+    assert found == {'1', '3'}
+
+
+def test_bulk_check_accepts_integer_ids(instance_name):
+    stateful_manager.add_processed_id('radarr', instance_name, '42')
+
+    assert stateful_manager.is_processed_bulk('radarr', instance_name, [42, 43]) == {'42'}
+
+
+def test_bulk_check_matches_single_checks(instance_name):
+    stateful_manager.add_processed_id('radarr', instance_name, '7')
+    media_ids = ['5', '6', '7']
+
+    found = stateful_manager.is_processed_bulk('radarr', instance_name, media_ids)
+
+    assert found == {media_id for media_id in media_ids
+                     if stateful_manager.is_processed('radarr', instance_name, media_id)}
+
+
+def test_bulk_check_treats_everything_as_unprocessed_when_disabled(instance_name, disable_state_management):
+    stateful_manager.add_processed_id('radarr', instance_name, '1')
+    disable_state_management(instance_name)
+
+    assert stateful_manager.is_processed_bulk('radarr', instance_name, ['1', '2']) == set()
+
+
+def test_add_processed_ids_records_every_id(instance_name):
+    assert stateful_manager.add_processed_ids('radarr', instance_name, ['10', 11, '12'])
+
+    assert stateful_manager.get_processed_ids('radarr', instance_name) == {'10', '11', '12'}
+
+
+def test_add_processed_ids_skips_ids_already_recorded(instance_name):
+    stateful_manager.add_processed_id('radarr', instance_name, '20')
+
+    assert stateful_manager.add_processed_ids('radarr', instance_name, ['20', '21'])
+    assert stateful_manager.get_processed_ids('radarr', instance_name) == {'20', '21'}
+
+
+def test_add_processed_ids_with_no_ids_is_a_no_op(instance_name):
+    assert stateful_manager.add_processed_ids('radarr', instance_name, [])
+    assert stateful_manager.get_processed_ids('radarr', instance_name) == set()
+
+
+def test_add_processed_ids_rejects_unknown_app_type(instance_name):
+    assert not stateful_manager.add_processed_ids('not-an-app', instance_name, ['1'])
+
+
+def test_add_processed_ids_writes_nothing_when_disabled(instance_name, disable_state_management):
+    disable_state_management(instance_name)
+
+    assert stateful_manager.add_processed_ids('radarr', instance_name, ['30', '31'])
+    assert stateful_manager.get_processed_ids('radarr', instance_name) == set()
@@ -0,0 +1,79 @@
+"""Tests for helpers in the Flask web server module"""
+
+import logging
+
+from src.primary import web_server
+
+
+def _access_log_record(request_line):
+    """Build a record shaped like Werkzeug's access log line ('"%s" %s %s' % (request_line, code, size))"""
+    return logging.LogRecord('werkzeug', logging.INFO, __file__, 0, '"%s" %s %s', (request_line, '200', '-'), None)
+
+
+def test_polling_filter_drops_polled_endpoints():
+    request_filter = web_server._PollingRequestFilter()
+
+    for path in ('/api/logs/all?limit=100', '/api/hunt-manager', '/logs'):
+        assert not request_filter.filter(_access_log_record(f'GET {path} HTTP/1.1'))
+
+
+def test_polling_filter_keeps_other_requests():
+    request_filter = web_server._PollingRequestFilter()
+
+    assert request_filter.filter(_access_log_record('GET /api/settings HTTP/1.1'))
+    assert request_filter.filter(_access_log_record('POST /login HTTP/1.1'))
+
+
+def test_polling_filter_keeps_records_without_a_request_line():
+    request_filter = web_server._PollingRequestFilter()
+    plain = logging.LogRecord('werkzeug', logging.INFO, __file__, 0, 'Running on http://0.0.0.0:9705', None, None)
+    non_string = logging.LogRecord('werkzeug', logging.INFO, __file__, 0, '%s', (42,), None)
+
+    assert request_filter.filter(plain)
+    assert request_filter.filter(non_string)
+
+
+def test_conditional_response_sets_etag_and_revalidation(web_app):
+    with web_app.test_request_context('/api/settings/radarr'):
+        response = web_server._conditional_response(b'{"a":1}')
+
+    assert response.status_code == 200
+    assert response.get_etag()[0]
+    assert response.headers['Cache-Control'] == 'no-cache'
+    assert response.mimetype == 'application/json'
+    assert response.get_data() == b'{"a":1}'
+
+
+def test_conditional_response_etag_follows_body(web_app):
+    with web_app.test_request_context('/api/settings/radarr'):
+        first = web_server._conditional_response(b'{"a":1}')
+        same = web_server._conditional_response(b'{"a":1}')
+        changed = web_server._conditional_response(b'{"a":2}')
+
+    assert first.get_etag() == same.get_etag()
+    assert first.get_etag() != changed.get_etag()
+
+
+def test_conditional_response_returns_304_for_matching_etag(web_app):
+    with web_app.test_request_context('/api/settings/radarr'):
+        etag = web_server._conditional_response(b'{"a":1}').get_etag()[0]
+
+    with web_app.test_request_context('/api/settings/radarr', headers={'If-None-Match': f'"{etag}"'}):
+        response = web_server._conditional_response(b'{"a":1}')
+
+    assert response.status_code == 304
+
+
+def test_conditional_response_returns_body_for_stale_etag(web_app):
+    with web_app.test_request_context('/api/settings/radarr', headers={'If-None-Match': '"stale"'}):
+        response = web_server._conditional_response(b'{"a":1}')
+
+    assert response.status_code == 200
+    assert response.get_data() == b'{"a":1}'
+
+
+def test_conditional_response_keeps_mimetype(web_app):
+    with web_app.test_request_context('/logs'):
+        response = web_server._conditional_response(b'line one\n', mimetype='text/plain')
+
+    assert response.mimetype == 'text/plain'